@@ -543,4 +543,46 @@ except TypeError as e:
     #        print(f"  First dict value type: {type(value[first_dict_key])}")
 
 except Exception as e:
-    print(f"Terjadi error tak terduga saat menyimpan JSON: {e}")
\ No newline at end of file
+    print(f"Terjadi error tak terduga saat menyimpan JSON: {e}")
+
+# ============================================
+# BAGIAN 8: EKSPOR BINER (KOLOMNAR) UNTUK DJANGO
+# ============================================
+# cluster_results.json di atas menyimpan 1 entri JSON per tiket (label + 2 float PCA),
+# jadi ukurannya membengkak seiring jumlah tiket. Backend membaca versi biner ini
+# dengan np.load(mmap_mode='r'), sehingga waktu load & memori tidak ikut membengkak:
+#   - cluster_labels.npy     : label cluster per tiket (int16)
+#   - cluster_pca_coords.npy : koordinat PCA per tiket, shape (n, 2) (float32)
+#   - cluster_sample_idx.npy : indeks tiket sampel scatter per cluster (int64), urutan bertingkat
+#   - cluster_summary.json   : ringkasan kecil (tanpa data per tiket), plus sample_offsets &
+#                              cluster_sizes untuk cluster_sample_idx.npy
+# Sampel scatter dihitung di sini (sekali per ekspor), bukan setiap backend memuat file.
+# Salin keempat file ke backend/tickets/static/clustering/
+import os
+import sys
+
+print("\nMenyimpan hasil clustering dalam format biner...")
+try:
+    # Fungsi yang sama dengan fallback backend, supaya urutan sampel identik
+    sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'backend'))
+    from tickets.utils.cluster_store import stratified_sample_index
+
+    labels_array = np.ascontiguousarray(np.asarray(cluster_labels), dtype=np.int16)
+    coords_array = np.ascontiguousarray(np.asarray(pca_coords)[:, :2], dtype=np.float32)
+    np.save('cluster_labels.npy', labels_array)
+    np.save('cluster_pca_coords.npy', coords_array)
+
+    sample_idx, sample_offsets, cluster_sizes = stratified_sample_index(
+        coords_array, labels_array, cluster_results['num_clusters']
+    )
+    np.save('cluster_sample_idx.npy', sample_idx)
+
+    cluster_summary = {key: value for key, value in cluster_results.items() if key not in ('cluster_labels', 'pca_coords')}
+    cluster_summary['num_points'] = int(len(cluster_labels))
+    cluster_summary['sample_offsets'] = sample_offsets.tolist()
+    cluster_summary['cluster_sizes'] = cluster_sizes.tolist()
+    with open('cluster_summary.json', 'w') as f:
+        json.dump(cluster_summary, f, default=str)
+    print("Hasil biner disimpan: cluster_labels.npy, cluster_pca_coords.npy, cluster_sample_idx.npy, cluster_summary.json")
+except Exception as e:
+    print(f"Terjadi error saat menyimpan hasil biner: {e}")
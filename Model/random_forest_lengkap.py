@@ -393,11 +393,15 @@ df.to_csv('dataset_random-forest.csv', index=False)
 df.to_excel('dataset_random-forest.xlsx', index=False, sheet_name='Data Utama')
 
 import joblib
+import os
 
 # Asumsi: rf_model sudah fit, encoders & scaler dari atas
 try:
-    # Save model RF
-    joblib.dump(rf_model, 'rf_sla_model.pkl')
+    # Save model RF (uncompressed, supaya backend bisa load dengan mmap_mode='r').
+    # Tulis ke file sementara lalu os.replace, jangan timpa file lama di tempat:
+    # worker yang me-mmap file lama bisa kena SIGBUS / membaca data rusak
+    joblib.dump(rf_model, 'rf_sla_model.pkl.tmp', compress=0)
+    os.replace('rf_sla_model.pkl.tmp', 'rf_sla_model.pkl')
 
     # Save encoders (dict untuk multiple kolom)
     joblib.dump(encoders, 'label_encoders.pkl')  # Semua le dalam dict
@@ -0,0 +1,17 @@
+# Konfigurasi gunicorn: gunicorn sla_backend.wsgi (dijalankan dari folder backend/)
+import gc
+import multiprocessing
+import os
+
+bind = os.environ.get('GUNICORN_BIND', '0.0.0.0:8000')
+workers = int(os.environ.get('GUNICORN_WORKERS', multiprocessing.cpu_count() * 2 + 1))
+
+# Muat aplikasi (dan model, lihat PREDICTOR_WARMUP di wsgi.py) sekali di master sebelum fork,
+# jadi array pohon RandomForest dibagi copy-on-write ke semua worker, bukan disalin per worker
+preload_app = True
+
+
+def pre_fork(server, worker):
+    # Pindahkan objek yang sudah ada ke generasi permanen GC: collector di worker
+    # tidak menulis ke header objek tersebut, halaman memori tetap shared
+    gc.freeze()
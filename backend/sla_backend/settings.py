@@ -10,6 +10,7 @@ For the full list of settings and their values, see
 https://docs.djangoproject.com/en/5.2/ref/settings/
 """
 
+import tempfile
 from pathlib import Path
 
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
@@ -37,6 +38,7 @@ INSTALLED_APPS = [
     'django.contrib.sessions',
     'django.contrib.messages',
     'django.contrib.staticfiles',
+    'django.contrib.postgres',  # Wajib untuk OpClass di index (ticket_number_trgm_idx)
     'rest_framework',  # DRF
     'rest_framework.authtoken',
     'corsheaders',     # CORS
@@ -133,6 +135,20 @@ DATABASES = {
     }
 }
 
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+    },
+    # Cache response endpoint analitik (/api/stats/...): file-based supaya invalidasi
+    # dari manage.py import_tickets terlihat oleh semua worker gunicorn
+    'analytics': {
+        'BACKEND': 'django.core.cache.backends.filebased.FileBasedCache',
+        'LOCATION': Path(tempfile.gettempdir()) / 'sla_backend_analytics_cache',
+        'TIMEOUT': 3600,  # Batas atas umur entri jika tiket diubah di luar import_tickets
+    },
+}
+ANALYTICS_CACHE_ALIAS = 'analytics'
+
 # DRF settings sederhana
 REST_FRAMEWORK = {
     'DEFAULT_PERMISSION_CLASSES': [
@@ -145,6 +161,45 @@ REST_FRAMEWORK = {
     ],
 }
 
+# Cache hasil prediksi SLAPredictor (jumlah entri & umur dalam detik)
+PREDICTION_CACHE_SIZE = 1024
+PREDICTION_CACHE_TTL = 300
+
+# Muat model saat wsgi/asgi dimuat (worker server), bukan saat request prediksi pertama.
+# Perintah manage.py (migrate, import_tickets, test) tidak memuat model sama sekali.
+PREDICTOR_WARMUP = True
+
+# joblib.load(..., mmap_mode=...) untuk rf_sla_model.pkl (None = load biasa ke memori).
+# 'r' butuh pickle uncompressed (lihat manage.py convert_model_mmap) dan deploy yang
+# mengganti file secara atomik (os.replace / mv dari direktori yang sama), bukan cp atau
+# tulis di tempat: halaman yang di-mmap ikut berubah, worker bisa kena SIGBUS.
+# Hemat memorinya kecil (sklearn menyalin array node pohon saat unpickle), jadi default None
+PREDICTOR_MMAP_MODE = None
+
+# Engine inferensi RandomForest: 'flat' (FlatForest untuk batch kecil) atau 'sklearn'
+PREDICTOR_INFERENCE = 'flat'
+
+# PredictionLog ditulis async via bulk_create (False = tulis langsung per request)
+PREDICTION_LOG_ASYNC = True
+PREDICTION_LOG_BATCH_SIZE = 500
+PREDICTION_LOG_FLUSH_INTERVAL = 1.0  # detik
+PREDICTION_LOG_QUEUE_SIZE = 10000
+
+# Pagination /api/tickets/: COUNT di-cache per kombinasi filter (detik).
+# Listing tanpa filter memakai estimasi pg_class.reltuples jika tabel >= threshold baris (None = selalu COUNT)
+TICKET_COUNT_CACHE_TTL = 30
+TICKET_APPROXIMATE_COUNT_THRESHOLD = 1000000
+
+# /api/tickets/export/: jumlah baris per fetch server-side cursor (dan per row group Parquet)
+TICKET_EXPORT_CHUNK_SIZE = 5000
+
+# /api/stats/, violation-by-category, monthly-trend dijawab dari rollup harian TicketDailyStat
+# (untuk filter yang ada di kolom kunci rollup; filter lain tetap scan tabel Ticket)
+TICKET_STATS_USE_ROLLUP = True
+
+# Jumlah thread untuk query DB paralel di /api/dashboard/summary/ (tiap thread = satu koneksi DB)
+DASHBOARD_SUMMARY_WORKERS = 3
+
 
 # Password validation
 # https://docs.djangoproject.com/en/5.2/ref/settings/#auth-password-validators
@@ -14,3 +14,11 @@ from django.core.wsgi import get_wsgi_application
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'sla_backend.settings')
 
 application = get_wsgi_application()
+
+# Warm-up: muat model sebelum worker menerima request pertama
+from django.conf import settings  # noqa: E402
+
+if getattr(settings, 'PREDICTOR_WARMUP', True):
+    from tickets.views import model_registry  # noqa: E402
+
+    model_registry.warm_up()
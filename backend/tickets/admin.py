@@ -1,6 +1,6 @@
 from django.contrib import admin
 
-from .models import ClusterSummary, PredictionLog, Ticket, UserProfile
+from .models import ClusterSummary, PredictionLog, Ticket, TicketDailyStat, UserProfile
 
 
 @admin.register(Ticket)
@@ -9,6 +9,12 @@ class TicketAdmin(admin.ModelAdmin):
     list_filter = ('priority', 'category', 'is_sla_violated')
     search_fields = ('number', 'item')
 
+@admin.register(TicketDailyStat)
+class TicketDailyStatAdmin(admin.ModelAdmin):
+    list_display = ('day', 'priority', 'category', 'is_sla_violated', 'ticket_count')
+    list_filter = ('priority', 'is_sla_violated')
+    date_hierarchy = 'day'
+
 @admin.register(PredictionLog)
 class PredictionLogAdmin(admin.ModelAdmin):
     list_display = ('created_at', 'user', 'input_data', 'prediction_result')
@@ -0,0 +1,109 @@
+import csv
+import io
+import os
+import random
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+from django.core.management import call_command
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+from django.utils import timezone
+from tickets.models import Ticket
+from tickets.utils.ticket_columns import COLUMN_MAP, DATE_FORMAT
+
+
+def generate_csv(path, rows, seed=42):
+    """ Buat CSV tiket sintetis dengan kolom yang sama seperti processed_tickets.csv """
+    rng = random.Random(seed)
+    base = datetime(2022, 1, 1)
+    with open(path, 'w', newline='', encoding='utf-8') as f:
+        writer = csv.writer(f)
+        writer.writerow([csv_col for csv_col, _, _ in COLUMN_MAP])
+        for i in range(rows):
+            open_dt = base + timedelta(minutes=rng.randint(0, 60 * 24 * 365 * 3))
+            due_dt = open_dt + timedelta(days=rng.randint(0, 10))
+            closed_dt = open_dt + timedelta(hours=rng.randint(1, 240))
+            writer.writerow([
+                f'BENCH{i:09d}',
+                rng.choice(['1 - Critical', '2 - High', '3 - Medium', '4 - Low']),
+                rng.choice(['kegagalan proses', 'transaction', 'drop', 'application', 'hardware']),
+                open_dt.strftime(DATE_FORMAT),
+                closed_dt.strftime(DATE_FORMAT) if rng.random() > 0.1 else '',
+                due_dt.strftime(DATE_FORMAT),
+                round(rng.uniform(-5, 5), 3),
+                f'application {rng.randint(1, 300)}',
+                rng.randint(0, 1),
+                rng.choice(['Hari Kerja', 'Hari Libur']),
+                rng.choice(['Hari Kerja', 'Hari Libur']),
+                (due_dt - open_dt).days,
+                open_dt.month,
+                open_dt.strftime('%A'),
+                open_dt.hour,
+                due_dt.strftime('%A'),
+                due_dt.hour,
+                round(rng.uniform(0, 5), 3),
+                rng.randint(1, 100),
+                rng.randint(1, 10),
+                round(rng.uniform(0, 5), 3),
+                round(rng.uniform(0, 3), 3),
+                round(rng.random(), 3),
+            ])
+
+
+def legacy_import(path):
+    """ Alur import lama: satu Ticket.objects.create + strptime per baris """
+    tz = timezone.get_default_timezone()
+    with open(path, 'r', encoding='utf-8') as file:
+        for row in csv.DictReader(file):
+            values = {}
+            for csv_col, field, kind in COLUMN_MAP:
+                raw = row[csv_col]
+                if kind in ('datetime', 'datetime_null'):
+                    values[field] = datetime.strptime(raw, DATE_FORMAT).replace(tzinfo=tz) if raw else None
+                elif kind == 'float':
+                    values[field] = float(raw)
+                elif kind == 'int':
+                    values[field] = int(raw)
+                elif kind == 'bool':
+                    values[field] = bool(int(raw))
+                else:
+                    values[field] = raw
+            Ticket.objects.create(**values)
+
+
+class Command(BaseCommand):
+    help = 'Benchmark import tiket: ORM per baris vs bulk_create vs COPY (semua perubahan di-rollback)'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--rows', type=int, default=20000, help='Jumlah baris dataset sintetis')
+        parser.add_argument('--skip-orm', action='store_true', help='Lewati mode ORM per baris (lambat)')
+
+    def _run(self, name, rows, fn):
+        # Setiap mode berjalan di transaksi yang di-rollback, jadi tabel tidak berubah
+        start = time.perf_counter()
+        with transaction.atomic():
+            fn()
+            elapsed = time.perf_counter() - start
+            transaction.set_rollback(True)
+        self.stdout.write(f"{name:<12} {elapsed:8.2f} detik  {rows / elapsed:12,.0f} rows/sec")
+
+    def handle(self, *args, **options):
+        rows = options['rows']
+        if Ticket.objects.filter(number__startswith='BENCH').exists():
+            raise CommandError("Sudah ada tiket dengan prefix 'BENCH' di database, benchmark dibatalkan.")
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, 'benchmark_tickets.csv')
+            generate_csv(path, rows)
+            self.stdout.write(f"Dataset sintetis: {rows} baris ({os.path.getsize(path) / 1e6:.1f} MB)")
+
+            quiet = io.StringIO()
+            if not options['skip_orm']:
+                self._run('orm', rows, lambda: legacy_import(path))
+            self._run('bulk_create', rows, lambda: call_command('import_tickets', path=path, stdout=quiet))
+            if connection.vendor == 'postgresql':
+                self._run('copy', rows, lambda: call_command('import_tickets', path=path, copy=True, stdout=quiet))
+            else:
+                self.stdout.write(f"copy         dilewati (butuh PostgreSQL, database saat ini: {connection.vendor})")
@@ -0,0 +1,144 @@
+import random
+import statistics
+import time
+from datetime import datetime, timedelta
+
+import numpy as np
+import pandas as pd
+from django.core.management.base import BaseCommand
+from tickets.utils.model_utils import SLAPredictor
+
+SAMPLE_INPUT = {
+    'priority': '3 - Medium',
+    'category': 'kegagalan proses',
+    'item': 'application 84',
+    'sub_category': '',
+    'open_date': '2025-03-14T09:30',
+    'due_date': '2025-03-18T17:00',
+}
+
+
+def legacy_preprocess(predictor, input_data):
+    """ Salinan preprocess_input versi lama (DataFrame 1 baris + .loc) sebagai pembanding """
+    open_dt = datetime.fromisoformat(input_data['open_date'])
+    due_dt = datetime.fromisoformat(input_data['due_date'])
+
+    processed_df = pd.DataFrame(columns=predictor.feature_names)
+    processed_df.loc[0, 'Days to Due'] = (due_dt - open_dt).days
+    processed_df.loc[0, 'Open Month'] = open_dt.month
+    processed_df.loc[0, 'Application Creation Day of Week'] = open_dt.weekday() + 1
+    processed_df.loc[0, 'Application Creation Hour'] = open_dt.hour
+    processed_df.loc[0, 'Application SLA Deadline Day of Week'] = due_dt.weekday() + 1
+    processed_df.loc[0, 'Application SLA Deadline Hour'] = due_dt.hour
+    processed_df.loc[0, 'Is Open Date Off'] = predictor._is_off(open_dt)
+    processed_df.loc[0, 'Is Due Date Off'] = predictor._is_off(due_dt)
+
+    for notebook_col, react_col in [
+        ('Priority', 'priority'),
+        ('Category', 'category'),
+        ('Item', 'item'),
+        ('Sub Category', 'sub_category')
+    ]:
+        if notebook_col in predictor.encoders:
+            le = predictor.encoders[notebook_col]
+            input_val = input_data.get(react_col, 'nan').lower().strip()
+            if input_val in le.classes_:
+                encoded_val = le.transform([input_val])[0]
+            elif 'nan' in le.classes_:
+                encoded_val = le.transform(['nan'])[0]
+            elif 'unknown' in le.classes_:
+                encoded_val = le.transform(['unknown'])[0]
+            else:
+                encoded_val = -1
+            processed_df.loc[0, notebook_col] = encoded_val
+
+    processed_df = processed_df.fillna(0)
+    cols_to_scale = [col for col in predictor.scaled_feature_names if col in processed_df.columns]
+    if cols_to_scale:
+        processed_df[cols_to_scale] = predictor.scaler.transform(processed_df[cols_to_scale])
+    return processed_df[predictor.feature_names].values
+
+
+def legacy_predict(predictor, input_data):
+    """ Alur predict() lama: preprocessing DataFrame + predict dan predict_proba terpisah """
+    X = legacy_preprocess(predictor, input_data)
+    predictor.model.predict(X)
+    predictor.model.predict_proba(X)
+
+
+def generate_records(predictor, count, seed=42):
+    """ Payload tiket acak (kategori dari encoders, tanggal acak) untuk benchmark batch """
+    rng = random.Random(seed)
+    options = {
+        react_col: [str(value) for value in lookup]
+        for react_col, _, lookup, _ in predictor._encoding_plan
+    }
+    base = datetime(2025, 1, 1)
+    records = []
+    for _ in range(count):
+        open_dt = base + timedelta(minutes=rng.randint(0, 365 * 24 * 60))
+        due_dt = open_dt + timedelta(hours=rng.randint(1, 240))
+        record = {col: rng.choice(values) for col, values in options.items()}
+        record['open_date'] = open_dt.strftime('%Y-%m-%dT%H:%M')
+        record['due_date'] = due_dt.strftime('%Y-%m-%dT%H:%M')
+        records.append(record)
+    return records
+
+
+class Command(BaseCommand):
+    help = 'Benchmark latensi p50/p95 prediksi satu tiket (sebelum vs sesudah optimasi)'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--iterations', type=int, default=500, help='Jumlah pengulangan per skenario')
+        parser.add_argument('--warmup', type=int, default=20, help='Pengulangan pemanasan (tidak diukur)')
+        parser.add_argument(
+            '--batch-sizes', type=int, nargs='+', default=[1, 10, 100, 500, 1000, 5000],
+            help='Ukuran batch untuk perbandingan predict_proba sklearn vs FlatForest',
+        )
+
+    def _measure(self, fn, iterations, warmup):
+        for _ in range(warmup):
+            fn()
+        timings = []
+        for _ in range(iterations):
+            start = time.perf_counter()
+            fn()
+            timings.append((time.perf_counter() - start) * 1000)
+        timings.sort()
+        return statistics.median(timings), timings[int(len(timings) * 0.95) - 1]
+
+    def handle(self, *args, **options):
+        predictor = SLAPredictor()
+        iterations = options['iterations']
+        warmup = options['warmup']
+
+        scenarios = [
+            ('preprocess (lama, DataFrame)', lambda: legacy_preprocess(predictor, SAMPLE_INPUT)),
+            ('preprocess (baru, feature plan)', lambda: predictor.preprocess_input(SAMPLE_INPUT)),
+            ('predict (lama)', lambda: legacy_predict(predictor, SAMPLE_INPUT)),
+            ('predict (baru, tanpa cache)', lambda: predictor.predict(SAMPLE_INPUT, use_cache=False)),
+            ('predict (baru, cache hit)', lambda: predictor.predict(SAMPLE_INPUT)),
+        ]
+
+        self.stdout.write(f"{iterations} iterasi per skenario")
+        for name, fn in scenarios:
+            p50, p95 = self._measure(fn, iterations, warmup)
+            self.stdout.write(f"{name:<34} p50={p50:8.3f} ms  p95={p95:8.3f} ms")
+
+        if predictor.flat_forest is not None:
+            self._compare_engines(predictor, options['batch_sizes'])
+
+    def _compare_engines(self, predictor, batch_sizes):
+        """ predict_proba sklearn vs FlatForest per ukuran batch (median 5x), plus cek bit-identik """
+        self.stdout.write("\npredict_proba per ukuran batch (sklearn vs FlatForest)")
+        for size in batch_sizes:
+            X = predictor.preprocess_batch(generate_records(predictor, size))
+            identical = np.array_equal(predictor.model.predict_proba(X), predictor.flat_forest.predict_proba(X))
+            row = []
+            for fn in (predictor.model.predict_proba, predictor.flat_forest.predict_proba):
+                p50, _ = self._measure(lambda: fn(X), 5, 1)
+                row.append((p50, size / p50 * 1000))
+            self.stdout.write(
+                f"{size:>6} baris  sklearn {row[0][0]:9.3f} ms ({row[0][1]:10,.0f} rows/sec)  "
+                f"flat {row[1][0]:9.3f} ms ({row[1][1]:10,.0f} rows/sec)  bit-identik={identical}"
+            )
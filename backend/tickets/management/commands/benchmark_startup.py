@@ -0,0 +1,79 @@
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+# Yang terjadi saat manage.py/worker memuat URLconf (termasuk tickets.views)
+LOAD_URLS = (
+    "import django; django.setup(); "
+    "from django.urls import get_resolver; get_resolver().url_patterns; "
+)
+WARM_UP = "from tickets.views import model_registry; model_registry.warm_up(); "
+
+SCENARIOS = [
+    ('URLconf (lazy, model belum dimuat)', LOAD_URLS),
+    ('URLconf + warm_up() (seperti import lama)', LOAD_URLS + WARM_UP),
+]
+
+HEAVY_MODULES = ['pandas', 'sklearn', 'holidays', 'joblib']
+
+
+def parse_importtime(stderr):
+    """
+    Parse output `python -X importtime`.
+    Mengembalikan (total self us, {modul top-level: (self_us, cumulative_us)}, set semua modul).
+    """
+    modules = {}
+    imported = set()
+    total_self = 0
+    for line in stderr.splitlines():
+        if not line.startswith('import time:') or 'self [us]' in line:
+            continue
+        self_us, cumulative_us, name = line[len('import time:'):].split('|', 2)
+        total_self += int(self_us)
+        imported.add(name.strip())
+        name = name[1:]
+        if not name.startswith(' '):  # Indentasi = diimpor oleh modul lain
+            modules[name] = (int(self_us), int(cumulative_us))
+    return total_self, modules, imported
+
+
+class Command(BaseCommand):
+    help = 'Benchmark waktu startup Django (python -X importtime) dengan dan tanpa memuat model'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--runs', type=int, default=3, help='Jumlah proses per skenario (median)')
+        parser.add_argument('--top', type=int, default=8, help='Jumlah modul paling lambat yang ditampilkan')
+
+    def _run_once(self, code):
+        env = dict(os.environ, DJANGO_SETTINGS_MODULE=os.environ.get('DJANGO_SETTINGS_MODULE', 'sla_backend.settings'))
+        start = time.perf_counter()
+        proc = subprocess.run(
+            [sys.executable, '-X', 'importtime', '-c', code],
+            cwd=settings.BASE_DIR, env=env, capture_output=True, text=True,
+        )
+        elapsed = time.perf_counter() - start
+        if proc.returncode != 0:
+            raise RuntimeError(proc.stderr.strip().splitlines()[-1])
+        return elapsed, proc.stderr
+
+    def handle(self, *args, **options):
+        for name, code in SCENARIOS:
+            walls = []
+            for _ in range(options['runs']):
+                elapsed, stderr = self._run_once(code)
+                walls.append(elapsed)
+            total_self, modules, imported = parse_importtime(stderr)
+
+            self.stdout.write(f"\n{name}")
+            self.stdout.write(f"  wall time proses (median {options['runs']}x): {statistics.median(walls) * 1000:8.1f} ms")
+            self.stdout.write(f"  total import time:                {total_self / 1000:8.1f} ms")
+            loaded_heavy = [m for m in HEAVY_MODULES if m in imported]
+            self.stdout.write(f"  modul berat yang diimpor: {', '.join(loaded_heavy) or '-'}")
+            slowest = sorted(modules.items(), key=lambda item: item[1][1], reverse=True)[:options['top']]
+            for module, (_, cumulative_us) in slowest:
+                self.stdout.write(f"    {cumulative_us / 1000:8.1f} ms  {module}")
@@ -0,0 +1,50 @@
+import statistics
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+from tickets.models import Ticket
+from tickets.serializers import TICKET_LIST_FIELDS, TicketSerializer, serialize_ticket_rows
+
+
+class Command(BaseCommand):
+    help = 'Benchmark throughput serialisasi listing tiket (rows/sec): TicketSerializer vs values() ringan'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--rows', type=int, default=5000, help='Jumlah tiket per pengukuran')
+        parser.add_argument('--repeat', type=int, default=5, help='Jumlah pengulangan (diambil median)')
+
+    def _measure(self, fn, repeat):
+        fn()  # Pemanasan
+        timings = []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            fn()
+            timings.append(time.perf_counter() - start)
+        return statistics.median(timings)
+
+    def handle(self, *args, **options):
+        rows = options['rows']
+        queryset = Ticket.objects.order_by('-open_date')[:rows]
+        count = queryset.count()
+        if not count:
+            raise CommandError('Tabel Ticket kosong; jalankan import_tickets dulu.')
+
+        # Data sudah diambil dari DB: hanya biaya serialisasi
+        tickets = list(queryset)
+        values = list(queryset.values(*TICKET_LIST_FIELDS))
+        serialize_only = [
+            ('TicketSerializer (lengkap)', lambda: TicketSerializer(tickets, many=True).data),
+            # Salinan dict: serialize_ticket_rows mengubah dict di tempat
+            ('values() ringan', lambda: serialize_ticket_rows([dict(row) for row in values])),
+        ]
+        # Termasuk query dan pembuatan objek model / dict
+        end_to_end = [
+            ('TicketSerializer (lengkap)', lambda: TicketSerializer(list(queryset.all()), many=True).data),
+            ('values() ringan', lambda: serialize_ticket_rows(list(queryset.values(*TICKET_LIST_FIELDS)))),
+        ]
+
+        for title, scenarios in (('Serialisasi saja', serialize_only), ('Query + serialisasi', end_to_end)):
+            self.stdout.write(f"{title} ({count} baris, median {options['repeat']}x):")
+            for name, fn in scenarios:
+                elapsed = self._measure(fn, options['repeat'])
+                self.stdout.write(f"  {name:<28} {elapsed * 1000:9.1f} ms  {count / elapsed:12,.0f} rows/sec")
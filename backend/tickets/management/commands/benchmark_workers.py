@@ -0,0 +1,79 @@
+import gc
+import multiprocessing
+import statistics
+
+from django.core.management.base import BaseCommand, CommandError
+from tickets.utils.model_registry import SMOKE_INPUT
+
+# Prediksi batch di setiap worker supaya semua pohon benar-benar disentuh
+WARMUP_BATCH = [SMOKE_INPUT] * 500
+
+
+def worker_memory(predictor, mmap_mode, barrier, results):
+    """ Dijalankan di proses anak (fork): muat model jika belum, prediksi, lalu laporkan memori """
+    import psutil
+    from tickets.utils.model_utils import SLAPredictor
+
+    if predictor is None:
+        predictor = SLAPredictor(mmap_mode=mmap_mode)
+    predictor.predict_batch(WARMUP_BATCH)
+
+    barrier.wait()  # Semua worker hidup bersamaan, jadi PSS membagi halaman shared dengan benar
+    info = psutil.Process().memory_full_info()
+    results.put({'rss': info.rss, 'pss': getattr(info, 'pss', None), 'uss': info.uss})
+    barrier.wait()
+
+
+class Command(BaseCommand):
+    help = 'Bandingkan RSS/PSS/USS per worker: load per worker, mmap, dan preload di master sebelum fork'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--workers', type=int, default=4, help='Jumlah proses worker per skenario')
+
+    def _run(self, name, workers, predictor=None, mmap_mode=None):
+        ctx = multiprocessing.get_context('fork')
+        barrier = ctx.Barrier(workers)
+        results = ctx.Queue()
+        procs = [
+            ctx.Process(target=worker_memory, args=(predictor, mmap_mode, barrier, results))
+            for _ in range(workers)
+        ]
+        for proc in procs:
+            proc.start()
+        stats = [results.get(timeout=300) for _ in procs]
+        for proc in procs:
+            proc.join()
+
+        mb = lambda key: [s[key] / 1e6 for s in stats if s[key] is not None]  # noqa: E731
+        pss = mb('pss')
+        self.stdout.write(
+            f"{name:<34} RSS {statistics.mean(mb('rss')):7.1f} MB  "
+            f"USS {statistics.mean(mb('uss')):7.1f} MB  "
+            + (f"PSS {statistics.mean(pss):7.1f} MB  total PSS {sum(pss):8.1f} MB" if pss else "PSS n/a")
+        )
+
+    def handle(self, *args, **options):
+        try:
+            import psutil  # noqa: F401
+        except ImportError:
+            raise CommandError('Benchmark ini butuh psutil (pip install psutil).')
+        if 'fork' not in multiprocessing.get_all_start_methods():
+            raise CommandError('Benchmark ini butuh start method fork (Linux/macOS).')
+
+        # sklearn diimpor dulu di proses ini: selisih antar skenario murni dari model, bukan dari import
+        import sklearn.ensemble  # noqa: F401
+        from tickets.utils.model_utils import SLAPredictor
+
+        workers = options['workers']
+        self.stdout.write(f"Rata-rata per worker ({workers} worker):")
+        self._run('load per worker', workers)
+        self._run("load per worker, mmap_mode='r'", workers, mmap_mode='r')
+
+        # Seperti gunicorn --preload: model dimuat sekali di master, lalu fork
+        predictor = SLAPredictor(mmap_mode='r')
+        predictor.predict_batch(WARMUP_BATCH)
+        gc.freeze()
+        try:
+            self._run("preload di master + fork", workers, predictor=predictor)
+        finally:
+            gc.unfreeze()
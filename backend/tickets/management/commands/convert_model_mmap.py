@@ -0,0 +1,30 @@
+import os
+
+import joblib
+from django.core.management.base import BaseCommand, CommandError
+
+DEFAULT_MODEL_PATH = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))),
+    'utils', 'rf_sla_model.pkl',
+)
+
+
+class Command(BaseCommand):
+    help = "Simpan ulang rf_sla_model.pkl tanpa kompresi agar bisa di-load dengan mmap_mode='r'"
+
+    def add_arguments(self, parser):
+        parser.add_argument('--path', type=str, default=DEFAULT_MODEL_PATH, help='Path ke file model .pkl')
+
+    def handle(self, *args, **options):
+        path = options['path']
+        if not os.path.exists(path):
+            raise CommandError(f'File tidak ditemukan: {path}')
+
+        model = joblib.load(path)
+        # Tulis ke file sementara lalu os.replace: ModelRegistry tidak pernah melihat file setengah jadi
+        tmp_path = f'{path}.tmp'
+        joblib.dump(model, tmp_path, compress=0)
+        os.replace(tmp_path, path)
+        self.stdout.write(self.style.SUCCESS(
+            f'{os.path.basename(path)} disimpan uncompressed ({os.path.getsize(path) / 1e6:.1f} MB), siap untuk mmap_mode=\'r\'.'
+        ))
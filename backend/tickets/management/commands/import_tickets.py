@@ -1,61 +1,196 @@
-import csv
+import io
 import os  # Tambah import ini untuk path handling
-from django.core.management.base import BaseCommand
+import time
+
+import pandas as pd
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+from django.utils import timezone
 from tickets.models import Ticket
-from datetime import datetime
+from tickets.utils.daily_stats import track_ticket_changes
+from tickets.utils.response_cache import analytics_cache
+from tickets.utils.ticket_columns import COLUMN_MAP, DATE_FORMAT
+
+DEFAULT_CSV_PATH = os.path.join('tickets', 'management', 'commands', 'processed_tickets.csv')
+
+# Field yang ditimpa jika 'number' sudah ada (created_at dibiarkan)
+UPDATE_FIELDS = [field for _, field, _ in COLUMN_MAP if field != 'number']
+
+STAGING_TABLE = 'tickets_ticket_staging'
+COPY_NULL = '\\N'  # Penanda NULL di CSV untuk COPY (string kosong tetap string kosong)
+
+
+def parse_chunk(chunk):
+    """
+    Parse satu chunk CSV secara vektor (tanggal & angka per kolom, bukan per baris).
+    Mengembalikan (DataFrame siap simpan dengan nama field model, Series nomor tiket yang gagal di-parse).
+    """
+    tz = timezone.get_default_timezone()
+    parsed = pd.DataFrame(index=chunk.index)
+    invalid = pd.Series(False, index=chunk.index)
+
+    for csv_col, field, kind in COLUMN_MAP:
+        raw = chunk[csv_col]
+        if kind == 'str':
+            parsed[field] = raw
+        elif kind in ('datetime', 'datetime_null'):
+            values = pd.to_datetime(raw, format=DATE_FORMAT, errors='coerce')
+            bad = values.isna() if kind == 'datetime' else values.isna() & (raw.str.strip() != '')
+            invalid |= bad
+            parsed[field] = values.dt.tz_localize(tz)
+        else:
+            values = pd.to_numeric(raw, errors='coerce')
+            bad = values.isna()
+            if kind in ('int', 'bool'):
+                bad |= values.notna() & (values % 1 != 0)
+            invalid |= bad
+            if kind == 'bool':
+                values = values.fillna(0).astype(int).astype(bool)
+            elif kind == 'int':
+                values = values.fillna(0).astype(int)
+            parsed[field] = values
+
+    # Nomor tiket duplikat dalam satu chunk: ambil baris terakhir
+    # (ON CONFLICT tidak boleh mengenai baris yang sama dua kali)
+    parsed = parsed[~invalid].drop_duplicates(subset='number', keep='last')
+    return parsed, chunk.loc[invalid, 'Number']
+
+
+def build_tickets(parsed):
+    """ Ubah DataFrame hasil parse_chunk menjadi objek Ticket (NaT -> None) """
+    records = parsed.astype(object).where(parsed.notna(), None).to_dict('records')
+    return [Ticket(**record) for record in records]
+
 
 class Command(BaseCommand):
     help = 'Import tickets from CSV'
 
+    def add_arguments(self, parser):
+        parser.add_argument('--path', default=DEFAULT_CSV_PATH, help=f'Path file CSV (default: {DEFAULT_CSV_PATH})')
+        parser.add_argument('--chunk-size', type=int, default=10000, help='Jumlah baris CSV yang dibaca per chunk')
+        parser.add_argument('--batch-size', type=int, default=2000, help='batch_size untuk bulk_create')
+        parser.add_argument(
+            '--copy', action='store_true',
+            help='Load via PostgreSQL COPY FROM STDIN ke staging table lalu merge dengan INSERT ... ON CONFLICT',
+        )
+
     def handle(self, *args, **options):
-        # Path relatif ke subfolder commands (dari root project)
-        csv_path = os.path.join('tickets', 'management', 'commands', 'processed_tickets.csv')
-        
+        csv_path = options['path']
+
         # Debug: Cek apakah file ada
         if not os.path.exists(csv_path):
             self.stdout.write(self.style.ERROR(f"File tidak ditemukan: {csv_path}. Pastikan CSV di {csv_path}"))
             return
-        
+
         self.stdout.write(f"File ditemukan: {csv_path}")
-        
-        with open(csv_path, 'r', encoding='utf-8') as file:  # Tambah encoding untuk karakter Indonesia
-            reader = csv.DictReader(file)
-            imported_count = 0
-            for row in reader:
-                try:
-                    # Mapping fields (sesuai model terbaru dari panduan sebelumnya)
-                    Ticket.objects.create(
-                        number=row['Number'],                   
-                        priority=row['Priority'],
-                        category=row['Category'],
-                        open_date=datetime.strptime(row['Open Date'], '%Y-%m-%d %H:%M:%S'),
-                        closed_date=datetime.strptime(row['Closed Date'], '%Y-%m-%d %H:%M:%S') if row['Closed Date'] else None,
-                        due_date=datetime.strptime(row['Due Date'], '%Y-%m-%d %H:%M:%S'),
-                        time_left_incl_on_hold=float(row['Time Left Incl. On Hold']),
-                        item=row['Item'],               
-                        is_sla_violated=bool(int(row['Is SLA Violated'])),
-                        is_open_date_off=row['Is Open Date Off'],
-                        is_due_date_off=row['Is Due Date Off'],
-                        days_to_due=int(row['Days to Due']),
-                        open_month=int(row['Open Month']),
-                        application_creation_day_of_week=row['Application Creation Day of Week'],
-                        application_creation_hour=int(row['Application Creation Hour']),
-                        application_sla_deadline_day_of_week=row['Application SLA Deadline Day of Week'],
-                        application_sla_deadline_hour=int(row['Application SLA Deadline Hour']),
-                        resolution_duration=float(row['Resolution Duration']),
-                        total_tickets_resolved_wc=float(row['Total Tickets Resolved (Wc)']),
-                        sla_threshold=float(row['SLA Threshold']),
-                        average_resolution_time_ac=float(row['Average Resolution Time (Ac)']),
-                        sla_to_average_resolution_ratio_rc=float(row['SLA to Average Resolution Ratio (Rc)']),
-                        application_sla_compliance_rate=float(row['Application SLA Compliance Rate']),
-                        # Fields tambahan (dummy jika null, tapi di import ini biarkan default null)
-                        # assigned_to=None,  # Atau set dummy jika perlu
-                        # affected_users=None,
-                        # root_cause=None,
-                    )
-                    imported_count += 1
-                except ValueError as e:
-                    self.stdout.write(self.style.WARNING(f"Error parsing row {row.get('Number', 'unknown')}: {e}"))
-                    continue  # Skip row error, lanjut ke next
-            
-            self.stdout.write(self.style.SUCCESS(f'Import selesai! {imported_count} rows imported.'))
\ No newline at end of file
+
+        if options['copy']:
+            if connection.vendor != 'postgresql':
+                raise CommandError(f"--copy hanya didukung di PostgreSQL (database saat ini: {connection.vendor}).")
+            self.create_staging_table()
+            save = self.save_batch_copy
+        else:
+            save = self.save_batch
+
+        start = time.perf_counter()
+        imported_count = 0
+        skipped_count = 0
+
+        # dtype=str + keep_default_na=False: nilai teks seperti 'nan' tetap string apa adanya
+        reader = pd.read_csv(
+            csv_path, dtype=str, keep_default_na=False, encoding='utf-8',  # Encoding untuk karakter Indonesia
+            chunksize=options['chunk_size'],
+        )
+        try:
+            for chunk in reader:
+                parsed, invalid_numbers = parse_chunk(chunk)
+                for number in invalid_numbers:
+                    self.stdout.write(self.style.WARNING(f"Error parsing row {number or 'unknown'}: nilai tanggal/angka tidak valid"))
+                skipped_count += len(invalid_numbers)
+
+                imported_count += save(parsed, options)
+
+                elapsed = time.perf_counter() - start
+                self.stdout.write(f"  {imported_count} rows ({imported_count / elapsed:,.0f} rows/sec)")
+        finally:
+            # Batch yang sudah commit mengubah statistik, walaupun import berhenti di tengah
+            if imported_count:
+                analytics_cache.invalidate()
+
+        if options['copy']:
+            self.drop_staging_table()
+
+        elapsed = time.perf_counter() - start
+        rate = imported_count / elapsed if elapsed > 0 else 0
+        self.stdout.write(self.style.SUCCESS(
+            f'Import selesai! {imported_count} rows imported, {skipped_count} skipped '
+            f'dalam {elapsed:.1f} detik ({rate:,.0f} rows/sec).'
+        ))
+
+    def save_batch(self, parsed, options):
+        """ Upsert satu chunk (plus rollup TicketDailyStat) dalam satu transaksi; mengembalikan jumlah baris """
+        if parsed.empty:
+            return 0
+        with transaction.atomic(), track_ticket_changes(parsed['number']):
+            Ticket.objects.bulk_create(
+                build_tickets(parsed),
+                batch_size=options['batch_size'],
+                update_conflicts=True,
+                unique_fields=['number'],
+                update_fields=UPDATE_FIELDS,
+            )
+        return len(parsed)
+
+    def create_staging_table(self):
+        """ Temp table tanpa constraint dengan kolom yang sama seperti di COLUMN_MAP """
+        qn = connection.ops.quote_name
+        columns = ', '.join(qn(Ticket._meta.get_field(field).column) for _, field, _ in COLUMN_MAP)
+        with connection.cursor() as cursor:
+            cursor.execute(f'DROP TABLE IF EXISTS {qn(STAGING_TABLE)}')
+            cursor.execute(
+                f'CREATE TEMP TABLE {qn(STAGING_TABLE)} AS '
+                f'SELECT {columns} FROM {qn(Ticket._meta.db_table)} WITH NO DATA'
+            )
+
+    def drop_staging_table(self):
+        with connection.cursor() as cursor:
+            cursor.execute(f'DROP TABLE IF EXISTS {connection.ops.quote_name(STAGING_TABLE)}')
+
+    def save_batch_copy(self, parsed, options):
+        """
+        COPY satu chunk ke staging table, lalu merge ke tickets_ticket
+        dengan INSERT ... ON CONFLICT (number) DO UPDATE dalam satu transaksi
+        (termasuk update rollup TicketDailyStat).
+        """
+        if parsed.empty:
+            return 0
+
+        qn = connection.ops.quote_name
+        columns = [qn(Ticket._meta.get_field(field).column) for _, field, _ in COLUMN_MAP]
+        column_list = ', '.join(columns)
+        update_list = ', '.join(
+            f'{qn(Ticket._meta.get_field(field).column)} = EXCLUDED.{qn(Ticket._meta.get_field(field).column)}'
+            for field in UPDATE_FIELDS
+        )
+        pk_column = qn(Ticket._meta.get_field('number').column)
+        created_column = qn(Ticket._meta.get_field('created_at').column)
+
+        buffer = io.StringIO()
+        parsed.to_csv(buffer, header=False, index=False, na_rep=COPY_NULL)
+        buffer.seek(0)
+        copy_sql = f"COPY {qn(STAGING_TABLE)} ({column_list}) FROM STDIN WITH (FORMAT csv, NULL '{COPY_NULL}')"
+
+        with transaction.atomic(), track_ticket_changes(parsed['number']), connection.cursor() as cursor:
+            cursor.execute(f'TRUNCATE {qn(STAGING_TABLE)}')
+            raw_cursor = cursor.cursor
+            if hasattr(raw_cursor, 'copy_expert'):  # psycopg2
+                raw_cursor.copy_expert(copy_sql, buffer)
+            else:  # psycopg 3
+                with raw_cursor.copy(copy_sql) as copy:
+                    copy.write(buffer.getvalue())
+            cursor.execute(
+                f'INSERT INTO {qn(Ticket._meta.db_table)} ({column_list}, {created_column}) '
+                f'SELECT {column_list}, NOW() FROM {qn(STAGING_TABLE)} '
+                f'ON CONFLICT ({pk_column}) DO UPDATE SET {update_list}'
+            )
+        return len(parsed)
@@ -0,0 +1,17 @@
+import time
+
+from django.core.management.base import BaseCommand
+from tickets.utils.daily_stats import rebuild_daily_stats
+from tickets.utils.response_cache import analytics_cache
+
+
+class Command(BaseCommand):
+    help = 'Hitung ulang rollup TicketDailyStat dari seluruh tabel Ticket'
+
+    def handle(self, *args, **options):
+        start = time.perf_counter()
+        count = rebuild_daily_stats()
+        analytics_cache.invalidate()
+        self.stdout.write(self.style.SUCCESS(
+            f'Rollup selesai: {count} baris TicketDailyStat dalam {time.perf_counter() - start:.1f} detik.'
+        ))
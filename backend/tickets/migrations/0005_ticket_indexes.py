@@ -0,0 +1,33 @@
+# Generated by Django 5.2.7 on 2026-10-17 18:37
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tickets', '0004_clustersummary_alter_ticket_category_predictionlog_and_more'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='ticket',
+            index=models.Index(fields=['open_date'], name='ticket_open_date_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='ticket',
+            index=models.Index(fields=['priority', 'category', 'open_date'], name='ticket_prio_cat_open_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='ticket',
+            index=models.Index(fields=['category', 'open_date'], name='ticket_cat_open_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='ticket',
+            index=models.Index(condition=models.Q(('is_sla_violated', True)), fields=['open_date'], name='ticket_violated_open_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='ticket',
+            index=models.Index(condition=models.Q(('is_sla_violated', False)), fields=['open_date'], name='ticket_compliant_open_idx'),
+        ),
+    ]
@@ -0,0 +1,64 @@
+# Generated by Django 5.2.7 on 2026-10-17 18:58
+
+from django.db import migrations, models
+from django.db.models import Count, Sum
+from django.db.models.functions import TruncDate
+
+
+def populate_daily_stats(apps, schema_editor):
+    # Agregasi disalin dari tickets/utils/daily_stats.py saat migrasi ini dibuat,
+    # supaya migrasi tidak ikut berubah jika kode aplikasi berubah
+    Ticket = apps.get_model('tickets', 'Ticket')
+    TicketDailyStat = apps.get_model('tickets', 'TicketDailyStat')
+
+    rows = Ticket.objects.order_by().annotate(day=TruncDate('open_date')).values(
+        'day', 'priority', 'category', 'is_sla_violated',
+    ).annotate(
+        ticket_count=Count('number'),
+        resolution_duration_sum=Sum('resolution_duration'),
+        compliance_rate_sum=Sum('application_sla_compliance_rate'),
+    )
+    TicketDailyStat.objects.bulk_create(
+        [
+            TicketDailyStat(
+                day=row['day'],
+                priority=row['priority'],
+                category=row['category'],
+                is_sla_violated=row['is_sla_violated'],
+                ticket_count=row['ticket_count'],
+                resolution_duration_sum=row['resolution_duration_sum'] or 0,
+                compliance_rate_sum=row['compliance_rate_sum'] or 0,
+            )
+            for row in rows.iterator(chunk_size=5000)
+        ],
+        batch_size=5000,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tickets', '0005_ticket_indexes'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='TicketDailyStat',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('day', models.DateField()),
+                ('priority', models.CharField(max_length=20)),
+                ('category', models.CharField(max_length=50)),
+                ('is_sla_violated', models.BooleanField()),
+                ('ticket_count', models.IntegerField(default=0)),
+                ('resolution_duration_sum', models.FloatField(default=0)),
+                ('compliance_rate_sum', models.FloatField(default=0)),
+            ],
+            options={
+                'verbose_name_plural': 'Ticket Daily Stats',
+                'constraints': [models.UniqueConstraint(fields=('day', 'priority', 'category', 'is_sla_violated'), name='ticket_daily_stat_key')],
+            },
+        ),
+        # Isi rollup dari tiket yang sudah ada
+        migrations.RunPython(populate_daily_stats, migrations.RunPython.noop),
+    ]
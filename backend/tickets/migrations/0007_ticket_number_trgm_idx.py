@@ -0,0 +1,44 @@
+from django.contrib.postgres.indexes import GinIndex, OpClass
+from django.db import migrations
+from django.db.models.functions import Upper
+
+NUMBER_TRGM_INDEX = GinIndex(OpClass(Upper('number'), name='gin_trgm_ops'), name='ticket_number_trgm_idx')
+
+
+def add_number_trgm_index(apps, schema_editor):
+    # gin_trgm_ops hanya ada di PostgreSQL (pg_trgm); di SQLite dkk index dilewati
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    schema_editor.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+    Ticket = apps.get_model('tickets', 'Ticket')
+    with schema_editor.connection.cursor() as cursor:
+        constraints = schema_editor.connection.introspection.get_constraints(cursor, Ticket._meta.db_table)
+    # Sudah ada jika database menjalankan versi lama 0005 (yang memuat index ini)
+    if NUMBER_TRGM_INDEX.name not in constraints:
+        schema_editor.add_index(Ticket, NUMBER_TRGM_INDEX)
+
+
+def remove_number_trgm_index(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    schema_editor.remove_index(apps.get_model('tickets', 'Ticket'), NUMBER_TRGM_INDEX)
+    schema_editor.execute('DROP EXTENSION IF EXISTS pg_trgm')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('tickets', '0006_ticket_daily_stat'),
+    ]
+
+    operations = [
+        migrations.SeparateDatabaseAndState(
+            # Bukan TrigramExtension: saat rollback operasi itu tetap membaca pg_extension di non-PostgreSQL
+            database_operations=[
+                migrations.RunPython(add_number_trgm_index, remove_number_trgm_index),
+            ],
+            state_operations=[
+                migrations.AddIndex(model_name='ticket', index=NUMBER_TRGM_INDEX),
+            ],
+        ),
+    ]
@@ -1,6 +1,8 @@
 from django.contrib.auth.models import User as AuthUser
 from django.contrib.postgres.fields import ArrayField
+from django.contrib.postgres.indexes import GinIndex, OpClass
 from django.db import models
+from django.db.models.functions import Upper
 from django.utils import timezone
 
 
@@ -109,6 +111,51 @@ class Ticket(models.Model):
     class Meta:
         ordering = ['-open_date']  # Default order terbaru
         verbose_name_plural = 'Tickets'
+        # Index untuk filter + sort di dashboard (TicketViewSet & get_filtered_queryset)
+        indexes = [
+            models.Index(fields=['open_date'], name='ticket_open_date_idx'),
+            models.Index(fields=['priority', 'category', 'open_date'], name='ticket_prio_cat_open_idx'),
+            models.Index(fields=['category', 'open_date'], name='ticket_cat_open_idx'),
+            # Partial per status SLA (pengganti composite (is_sla_violated, open_date), lebih kecil)
+            models.Index(
+                fields=['open_date'],
+                condition=models.Q(is_sla_violated=True),
+                name='ticket_violated_open_idx',
+            ),
+            models.Index(
+                fields=['open_date'],
+                condition=models.Q(is_sla_violated=False),
+                name='ticket_compliant_open_idx',
+            ),
+            # Trigram untuk pencarian number__icontains (UPPER(number) LIKE UPPER('%...%'))
+            GinIndex(OpClass(Upper('number'), name='gin_trgm_ops'), name='ticket_number_trgm_idx'),
+        ]
+
+    def __str__(self):
+        return f"{self.number} - {self.item} ({self.priority})"
+
+class TicketDailyStat(models.Model):
+    """
+    Rollup harian tiket per (hari, prioritas, kategori, status SLA) untuk endpoint statistik dashboard.
+    Diperbarui inkremental oleh import_tickets (lihat tickets/utils/daily_stats.py);
+    jalankan `manage.py rebuild_ticket_stats` jika tiket diubah lewat jalur lain.
+    """
+    day = models.DateField()  # TruncDate(open_date) pada TIME_ZONE
+    priority = models.CharField(max_length=20)
+    category = models.CharField(max_length=50)
+    is_sla_violated = models.BooleanField()
+    ticket_count = models.IntegerField(default=0)
+    resolution_duration_sum = models.FloatField(default=0)
+    compliance_rate_sum = models.FloatField(default=0)  # Jumlah application_sla_compliance_rate
+
+    class Meta:
+        verbose_name_plural = 'Ticket Daily Stats'
+        constraints = [
+            models.UniqueConstraint(
+                fields=['day', 'priority', 'category', 'is_sla_violated'],
+                name='ticket_daily_stat_key',
+            ),
+        ]
 
     def __str__(self):
-        return f"{self.number} - {self.item} ({self.priority})"
\ No newline at end of file
+        return f"{self.day} {self.priority} / {self.category} (violated={self.is_sla_violated}): {self.ticket_count}"
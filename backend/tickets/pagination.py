@@ -0,0 +1,149 @@
+import base64
+import hashlib
+import json
+from datetime import datetime
+
+from django.conf import settings
+from django.core.cache import cache
+from django.core.paginator import Paginator
+from django.db import connection
+from django.utils.functional import cached_property
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import BasePagination
+from rest_framework.response import Response
+from rest_framework.utils.urls import replace_query_param
+
+
+def estimated_row_count(model):
+    """
+    Perkiraan jumlah baris dari statistik planner (pg_class.reltuples), tanpa scan tabel.
+    Mengembalikan None jika bukan PostgreSQL atau tabel belum pernah di-ANALYZE.
+    """
+    if connection.vendor != 'postgresql':
+        return None
+    with connection.cursor() as cursor:
+        cursor.execute('SELECT reltuples FROM pg_class WHERE oid = %s::regclass', [model._meta.db_table])
+        row = cursor.fetchone()
+    if not row or row[0] is None or row[0] < 0:
+        return None
+    return int(row[0])
+
+
+class CachedCountPaginator(Paginator):
+    """
+    Paginator yang menghitung COUNT paling banyak sekali per kombinasi filter
+    dalam TICKET_COUNT_CACHE_TTL detik (Django cache framework).
+
+    Untuk listing tanpa filter pada tabel yang sangat besar
+    (>= TICKET_APPROXIMATE_COUNT_THRESHOLD baris), jumlah diambil dari
+    estimasi planner alih-alih COUNT(*).
+    """
+
+    @cached_property
+    def count(self):
+        queryset = self.object_list
+        if not hasattr(queryset, 'query'):
+            return super().count
+
+        threshold = getattr(settings, 'TICKET_APPROXIMATE_COUNT_THRESHOLD', None)
+        if threshold and not queryset.query.where:
+            estimate = estimated_row_count(queryset.model)
+            if estimate is not None and estimate >= threshold:
+                return estimate
+
+        # Key = SQL query tanpa ORDER BY/LIMIT, jadi sort yang berbeda tetap berbagi count
+        sql = str(queryset.order_by().query)
+        key = 'ticket_count:' + hashlib.md5(sql.encode('utf-8')).hexdigest()
+        count = cache.get(key)
+        if count is None:
+            count = super().count
+            cache.set(key, count, getattr(settings, 'TICKET_COUNT_CACHE_TTL', 30))
+        return count
+
+
+class TicketCursorPagination(BasePagination):
+    """
+    Keyset (cursor) pagination untuk /api/tickets/?cursor=, diurutkan pada (open_date, number).
+    Halaman berikutnya diambil dengan WHERE (open_date, number) < cursor, bukan OFFSET,
+    jadi halaman dalam tetap secepat halaman pertama. Arah urutan mengikuti
+    ORDER BY queryset (parameter 'sort'); filter lain tidak berubah.
+    """
+    cursor_query_param = 'cursor'
+    page_size = 7
+    page_size_query_param = 'page_size'
+    max_page_size = 5000  # Lebih besar dari TicketPagination untuk klien export
+    invalid_cursor_message = 'Cursor tidak valid.'
+
+    def get_page_size(self, request):
+        try:
+            size = int(request.query_params[self.page_size_query_param])
+        except (KeyError, ValueError):
+            return self.page_size
+        return min(max(size, 1), self.max_page_size)
+
+    def encode_cursor(self, ticket):
+        # ticket: objek Ticket atau dict dari values() (listing ringan)
+        if isinstance(ticket, dict):
+            open_date, number = ticket['open_date'], ticket['number']
+        else:
+            open_date, number = ticket.open_date, ticket.number
+        payload = json.dumps({'d': open_date.isoformat(), 'n': number})
+        return base64.urlsafe_b64encode(payload.encode('utf-8')).decode('ascii')
+
+    def decode_cursor(self, request):
+        encoded = request.query_params.get(self.cursor_query_param)
+        if not encoded:
+            return None  # ?cursor= kosong -> halaman pertama
+        try:
+            payload = json.loads(base64.urlsafe_b64decode(encoded.encode('ascii')))
+            return datetime.fromisoformat(payload['d']), str(payload['n'])
+        except (TypeError, ValueError, KeyError, UnicodeError):
+            raise NotFound(self.invalid_cursor_message)
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.request = request
+        self.page_size = self.get_page_size(request)
+
+        ordering = queryset.query.order_by or queryset.model._meta.ordering
+        descending = bool(ordering) and str(ordering[0]).startswith('-')
+        prefix = '-' if descending else ''
+        queryset = queryset.order_by(f'{prefix}open_date', f'{prefix}number')
+
+        cursor = self.decode_cursor(request)
+        if cursor is not None:
+            open_date, number = cursor
+            # Setara (open_date, number) < cursor, ditulis agar bisa range-scan index open_date
+            if descending:
+                queryset = queryset.filter(open_date__lte=open_date).exclude(open_date=open_date, number__gte=number)
+            else:
+                queryset = queryset.filter(open_date__gte=open_date).exclude(open_date=open_date, number__lte=number)
+
+        results = list(queryset[:self.page_size + 1])
+        self.has_next = len(results) > self.page_size
+        results = results[:self.page_size]
+        self.next_cursor = self.encode_cursor(results[-1]) if self.has_next else None
+        return results
+
+    def get_next_link(self):
+        if not self.has_next:
+            return None
+        url = self.request.build_absolute_uri()
+        return replace_query_param(url, self.cursor_query_param, self.next_cursor)
+
+    def get_paginated_response(self, data):
+        return Response({
+            'next': self.get_next_link(),
+            'page_size': self.page_size,
+            'results': data,
+        })
+
+    def get_paginated_response_schema(self, schema):
+        return {
+            'type': 'object',
+            'required': ['results'],
+            'properties': {
+                'next': {'type': 'string', 'nullable': True, 'format': 'uri'},
+                'page_size': {'type': 'integer'},
+                'results': schema,
+            },
+        }
@@ -0,0 +1,27 @@
+import json
+
+from rest_framework.renderers import BaseRenderer
+
+
+class ExportRenderer(BaseRenderer):
+    """
+    Renderer untuk content negotiation endpoint export (?format=csv / ?format=parquet atau Accept).
+    Data export di-stream langsung oleh view (StreamingHttpResponse); renderer hanya
+    dipakai untuk response error DRF, yang dikirim sebagai JSON.
+    """
+    charset = None
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if renderer_context and renderer_context.get('response') is not None:
+            renderer_context['response']['Content-Type'] = 'application/json'
+        return json.dumps(data).encode('utf-8')
+
+
+class CSVExportRenderer(ExportRenderer):
+    media_type = 'text/csv'
+    format = 'csv'
+
+
+class ParquetExportRenderer(ExportRenderer):
+    media_type = 'application/vnd.apache.parquet'
+    format = 'parquet'
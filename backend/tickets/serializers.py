@@ -25,6 +25,23 @@ class TicketSerializer(serializers.ModelSerializer):
     def get_compliance_rate_percent(self, obj):
         return f"{obj.application_sla_compliance_rate * 100:.1f}%"
 
+
+# Kolom tabel tiket di Dashboard; listing /api/tickets/ hanya mengirim kolom ini,
+# detail (/api/tickets/<number>/, TicketDetailModal) tetap memakai TicketSerializer
+TICKET_LIST_FIELDS = ('number', 'item', 'priority', 'is_sla_violated', 'category', 'open_date')
+
+
+def serialize_ticket_rows(rows):
+    """
+    Representasi list dari dict queryset.values(*TICKET_LIST_FIELDS), tanpa field DRF per baris:
+    hanya open_date yang diformat (sama dengan TicketSerializer). Dict diubah di tempat.
+    """
+    tz = timezone.get_current_timezone()
+    for row in rows:
+        if row['open_date'] is not None:
+            row['open_date'] = timezone.localtime(row['open_date'], tz).strftime('%Y-%m-%d %H:%M:%S')
+    return rows
+
 # class StatsSerializer(serializers.Serializer):
 #     total_tickets = serializers.IntegerField()
 #     violation_count = serializers.IntegerField()
@@ -1,3 +1,501 @@
-from django.test import TestCase
+import base64
+import csv
+import io
+import json
+import os
+import random
+import tempfile
+import unittest
+from datetime import date, timedelta
+from unittest import mock
+from urllib.parse import parse_qs, urlsplit
+
+import numpy as np
+from django.db import DatabaseError, connection, transaction
+from django.test import SimpleTestCase, TestCase, TransactionTestCase, override_settings
+from django.utils import timezone
+from sklearn.ensemble import RandomForestClassifier
+
+from . import views
+from .models import PredictionLog, Ticket, TicketDailyStat
+from .utils.cluster_store import SAMPLE_IDX_FILE, ClusterStore, stratified_sample_index
+from .utils.daily_stats import KEY_FIELDS, SUM_FIELDS, rebuild_daily_stats, track_ticket_changes
+from .utils.flat_forest import FlatForest
+from .utils.log_writer import PredictionLogWriter
+from .utils.response_cache import analytics_cache
+from .utils.ticket_columns import COLUMN_MAP
+
+try:
+    import pyarrow.parquet as pq
+except ImportError:
+    pq = None
+
+MODEL_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'utils', 'rf_sla_model.pkl')
 
 # Create your tests here.
+
+PRIORITIES = ['1 - Critical', '2 - High', '3 - Medium', '4 - Low']
+CATEGORIES = [f'kategori {i}' for i in range(40)]
+
+
+def build_tickets(count, seed=42, start=3000000):
+    """ Objek Ticket sintetis (belum disimpan), number berurutan mulai dari start """
+    rng = random.Random(seed)
+    base = timezone.now() - timedelta(days=3 * 365)
+    tickets = []
+    for i in range(count):
+        open_date = base + timedelta(minutes=rng.randint(0, 3 * 365 * 24 * 60))
+        tickets.append(Ticket(
+            number=str(start + i),
+            priority=rng.choice(PRIORITIES),
+            category=rng.choice(CATEGORIES),
+            open_date=open_date,
+            closed_date=open_date + timedelta(hours=rng.randint(1, 200)),
+            due_date=open_date + timedelta(days=rng.randint(1, 10)),
+            time_left_incl_on_hold=rng.uniform(-5, 5),
+            item=f'application {rng.randint(1, 300)}',
+            is_sla_violated=rng.random() < 0.2,
+            is_open_date_off='Hari Kerja',
+            is_due_date_off='Hari Kerja',
+            days_to_due=rng.randint(1, 10),
+            open_month=open_date.month,
+            application_creation_day_of_week='Monday',
+            application_creation_hour=open_date.hour,
+            application_sla_deadline_day_of_week='Friday',
+            application_sla_deadline_hour=17,
+            resolution_duration=rng.uniform(0, 5),
+            total_tickets_resolved_wc=rng.randint(1, 100),
+            sla_threshold=rng.randint(1, 10),
+            average_resolution_time_ac=rng.uniform(0, 5),
+            sla_to_average_resolution_ratio_rc=rng.uniform(0, 3),
+            application_sla_compliance_rate=rng.random(),
+        ))
+    return tickets
+
+
+def seed_tickets(count, seed=42):
+    """ Isi tabel Ticket dengan data sintetis dalam jumlah besar """
+    Ticket.objects.bulk_create(build_tickets(count, seed), batch_size=5000)
+
+
+@unittest.skipUnless(connection.vendor == 'postgresql', 'EXPLAIN index test butuh PostgreSQL')
+class TicketIndexPlanTests(TestCase):
+    """
+    Pastikan query filter/sort dashboard memakai index dari migrasi 0005 (dan trigram 0007),
+    bukan sequential scan, pada dataset yang cukup besar.
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        seed_tickets(100000)
+        with connection.cursor() as cursor:
+            cursor.execute(f'ANALYZE {Ticket._meta.db_table}')
+
+    def assertUsesIndex(self, queryset, index_name):
+        plan = queryset.explain()
+        self.assertIn(index_name, plan)
+        self.assertNotIn(f'Seq Scan on {Ticket._meta.db_table}', plan)
+
+    def test_list_sorted_by_open_date(self):
+        self.assertUsesIndex(Ticket.objects.order_by('-open_date')[:7], 'ticket_open_date_idx')
+
+    def test_violated_filter_partial_index(self):
+        queryset = Ticket.objects.filter(is_sla_violated=True).order_by('-open_date')[:7]
+        self.assertUsesIndex(queryset, 'ticket_violated_open_idx')
+
+    def test_compliant_filter_partial_index(self):
+        queryset = Ticket.objects.filter(is_sla_violated=False).order_by('-open_date')[:7]
+        self.assertUsesIndex(queryset, 'ticket_compliant_open_idx')
+
+    def test_priority_and_category_filter(self):
+        queryset = Ticket.objects.filter(priority='2 - High', category='kategori 7').order_by('-open_date')[:7]
+        self.assertUsesIndex(queryset, 'ticket_prio_cat_open_idx')
+
+    def test_category_filter(self):
+        queryset = Ticket.objects.filter(category='kategori 7').order_by('-open_date')[:7]
+        self.assertUsesIndex(queryset, 'ticket_cat_open_idx')
+
+    def test_number_search_uses_trigram_index(self):
+        queryset = Ticket.objects.filter(number__icontains='3012345')
+        self.assertUsesIndex(queryset, 'ticket_number_trgm_idx')
+
+
+class FlatForestTests(SimpleTestCase):
+    """ FlatForest harus menghasilkan predict_proba yang bit-identik dengan sklearn """
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        rng = np.random.default_rng(0)
+        # Campuran fitur kode kategori (integer) dan numerik kontinu, seperti vektor SLAPredictor
+        cls.X_train = np.column_stack([
+            rng.integers(0, 40, size=(5000, 4)),
+            rng.normal(0, 1, size=(5000, 8)),
+        ]).astype(np.float64)
+        cls.y_train = (cls.X_train[:, 0] + 3 * cls.X_train[:, 5] + rng.normal(0, 5, 5000) > 20).astype(int)
+        cls.model = RandomForestClassifier(n_estimators=25, max_depth=10, random_state=0)
+        cls.model.fit(cls.X_train, cls.y_train)
+
+    def assertSameProba(self, model, X, chunk_size=256):
+        expected = model.predict_proba(X)
+        actual = FlatForest(model, chunk_size=chunk_size).predict_proba(X)
+        self.assertTrue(np.array_equal(expected, actual), f'selisih maks {np.abs(expected - actual).max()}')
+
+    def test_single_row(self):
+        for row in self.X_train[:20]:
+            self.assertSameProba(self.model, row[np.newaxis, :])
+
+    def test_batch_across_chunks(self):
+        rng = np.random.default_rng(1)
+        X = np.column_stack([rng.integers(-5, 45, size=(3000, 4)), rng.normal(0, 2, size=(3000, 8))])
+        self.assertSameProba(self.model, X, chunk_size=128)
+
+    def test_values_on_float32_rounding_boundary(self):
+        # sklearn membandingkan X dalam float32: nilai float64 tepat di sekitar threshold harus ikut dibulatkan
+        thresholds = np.concatenate([e.tree_.threshold[e.tree_.children_left != -1] for e in self.model.estimators_])
+        X = np.tile(self.X_train[:1], (len(thresholds) * 3, 1))
+        column = 5
+        X[:, column] = np.concatenate([thresholds, np.nextafter(thresholds, np.inf), np.nextafter(thresholds, -np.inf)])
+        self.assertSameProba(self.model, X)
+
+    def test_predict_matches_and_shallow_multiclass_forest(self):
+        y = np.digitize(self.X_train[:, 5], [-0.5, 0.5])  # 3 kelas
+        model = RandomForestClassifier(n_estimators=10, max_depth=3, random_state=0).fit(self.X_train, y)
+        self.assertSameProba(model, self.X_train[:500])
+        self.assertTrue(np.array_equal(model.predict(self.X_train[:500]), FlatForest(model).predict(self.X_train[:500])))
+
+    def test_rejects_nan(self):
+        X = self.X_train[:2].copy()
+        X[0, 3] = np.nan
+        with self.assertRaises(ValueError):
+            FlatForest(self.model).predict_proba(X)
+
+
+@unittest.skipUnless(os.path.exists(MODEL_PATH), 'Butuh artefak model rf_sla_model.pkl')
+class PredictorBatchTests(SimpleTestCase):
+    """ predict_batch/preprocess_batch harus sama persis dengan predict/preprocess_input per baris """
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        from .utils.model_utils import SLAPredictor
+        cls.predictor = SLAPredictor(inference='sklearn')
+
+    def base_record(self, **overrides):
+        record = {
+            'priority': '3 - Medium',
+            'category': 'kegagalan proses',
+            'item': 'application 84',
+            'sub_category': '',
+            'open_date': '2025-03-14T09:30',
+            'due_date': '2025-03-18T17:00',
+        }
+        record.update(overrides)
+        return record
+
+    def test_batch_equals_single(self):
+        # Hari libur di hari kerja yang hari sebelumnya hari kerja biasa: 01:30+07:00 lokal = hari sebelumnya di UTC
+        holidays = self.predictor.holiday_dates
+        holiday = next((d for d in sorted(holidays) if d.weekday() in range(1, 5) and d - timedelta(days=1) not in holidays), None)
+        if holiday is None:
+            self.skipTest('Tidak ada hari libur di hari kerja')
+        day_before = holiday - timedelta(days=1)
+        records = [
+            self.base_record(),
+            # Offset berbeda: jam & tanggal libur dihitung dari waktu lokal masing-masing
+            self.base_record(open_date=f'{holiday}T01:30+07:00', due_date=f'{day_before}T23:00-05:00'),
+            self.base_record(open_date='2024-12-31T23:59+07:00', due_date='2025-01-02T08:00Z'),
+            self.base_record(priority=' 1 - CRITICAL ', category='kategori tidak dikenal'),
+            {k: v for k, v in self.base_record().items() if k != 'sub_category'},
+        ]
+        batch = self.predictor.preprocess_batch(records)
+        single = np.vstack([self.predictor.preprocess_input(r) for r in records])
+        self.assertTrue(np.array_equal(batch, single))
+        self.assertEqual(self.predictor.predict_batch(records), [self.predictor.predict(r, use_cache=False) for r in records])
+
+    def test_batch_rejects_what_single_rejects(self):
+        invalid = [
+            self.base_record(due_date='2025-03-18T17:00+07:00'),  # naive vs ber-timezone
+            self.base_record(category=None),
+            self.base_record(open_date=None),
+            {k: v for k, v in self.base_record().items() if k != 'due_date'},
+        ]
+        for record in invalid:
+            with self.subTest(record=record):
+                with self.assertRaises(ValueError):
+                    self.predictor.preprocess_input(record)
+                with self.assertRaises(ValueError):
+                    self.predictor.preprocess_batch([self.base_record(), record])
+                self.assertEqual(self.predictor.predict(record)['status'], 'error')
+
+
+class PredictionLogWriterTests(SimpleTestCase):
+    def test_failed_batches_are_counted(self):
+        writer = PredictionLogWriter(batch_size=2, flush_interval=0.01, max_queue=3, enqueue_timeout=0)
+        with mock.patch.object(PredictionLog.objects, 'bulk_create', side_effect=DatabaseError('db down')):
+            for _ in range(10):
+                writer.log(input_data={}, prediction_result={})
+            writer.shutdown()
+        stats = writer.stats()
+        self.assertEqual(stats['written'], 0)
+        self.assertGreater(stats['failed'], 0)
+        self.assertEqual(stats['queued'] + stats['written'] + stats['dropped'] + stats['failed'], 10)
+
+
+class ClusterStoreTests(SimpleTestCase):
+    """ Sampel dari cluster_sample_idx.npy (ekspor k_proto.py) sama dengan sampel yang dihitung saat load """
+
+    def setUp(self):
+        rng = np.random.default_rng(3)
+        self.labels = rng.integers(0, 4, 5000).astype(np.int16)
+        self.coords = rng.normal(size=(5000, 2)).astype(np.float32)
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        np.save(os.path.join(self.tmp.name, 'cluster_labels.npy'), self.labels)
+        np.save(os.path.join(self.tmp.name, 'cluster_pca_coords.npy'), self.coords)
+        self.write_summary({'num_clusters': 4})
+
+    def write_summary(self, summary):
+        with open(os.path.join(self.tmp.name, 'cluster_summary.json'), 'w') as f:
+            json.dump(summary, f)
+
+    def store(self):
+        return ClusterStore(os.path.join(self.tmp.name, 'cluster_results.json'), max_points=300)
+
+    def test_exported_sample_matches_load_time_sample(self):
+        fallback = self.store()
+        expected = [fallback.get_charts(points=points) for points in (7, 100, 2000)]
+
+        sample_idx, offsets, sizes = stratified_sample_index(self.coords, self.labels, 4, max_points=300)
+        np.save(os.path.join(self.tmp.name, SAMPLE_IDX_FILE), sample_idx)
+        self.write_summary({'num_clusters': 4, 'sample_offsets': offsets.tolist(), 'cluster_sizes': sizes.tolist()})
+        exported = self.store()
+        self.assertEqual([exported.get_charts(points=points) for points in (7, 100, 2000)], expected)
+        self.assertIsInstance(exported._get_state()['sample_idx'], np.memmap)
+
+
+class DailyStatsTests(TestCase):
+    """ Rollup yang diperbarui track_ticket_changes harus sama dengan hasil rebuild_daily_stats() """
+
+    def setUp(self):
+        seed_tickets(300)
+        rebuild_daily_stats()
+
+    def snapshot(self):
+        return [
+            row[:len(KEY_FIELDS)] + tuple(round(value, 6) for value in row[len(KEY_FIELDS):])
+            for row in TicketDailyStat.objects.order_by(*KEY_FIELDS).values_list(*KEY_FIELDS, *SUM_FIELDS)
+        ]
+
+    def save_tracked(self, tickets):
+        # Seperti import_tickets: tulis tiket di dalam blok track_ticket_changes
+        with transaction.atomic(), track_ticket_changes([ticket.number for ticket in tickets]):
+            for ticket in tickets:
+                ticket.save()
+
+    def assertMatchesRebuild(self):
+        tracked = self.snapshot()
+        rebuild_daily_stats()
+        self.assertEqual(tracked, self.snapshot())
+
+    def test_insert_new_tickets(self):
+        self.save_tracked(build_tickets(50, seed=7, start=4000000))
+        self.assertEqual(Ticket.objects.count(), 350)
+        self.assertMatchesRebuild()
+
+    def test_upsert_moves_existing_tickets(self):
+        moved, reprioritized, recategorized, flipped = Ticket.objects.order_by('number')[:4]
+        moved.open_date -= timedelta(days=40)
+        reprioritized.priority = next(p for p in PRIORITIES if p != reprioritized.priority)
+        recategorized.category = next(c for c in CATEGORIES if c != recategorized.category)
+        flipped.is_sla_violated = not flipped.is_sla_violated
+        flipped.resolution_duration += 2
+        self.save_tracked([moved, reprioritized, recategorized, flipped])
+        self.assertMatchesRebuild()
+
+    def test_update_empties_bucket(self):
+        ticket = build_tickets(1, seed=9, start=4000000)[0]
+        ticket.category = 'kategori tunggal'
+        self.save_tracked([ticket])
+        self.assertTrue(TicketDailyStat.objects.filter(category='kategori tunggal').exists())
+
+        ticket.category = CATEGORIES[0]
+        self.save_tracked([ticket])
+        self.assertFalse(TicketDailyStat.objects.filter(category='kategori tunggal').exists())
+        self.assertMatchesRebuild()
+
+
+class TicketCursorPaginationTests(TestCase):
+    URL = '/api/tickets/'
+
+    def setUp(self):
+        seed_tickets(60)
+        # Banyak tiket dengan open_date sama: batas halaman jatuh di tengah grup
+        shared = timezone.now() - timedelta(days=10)
+        Ticket.objects.filter(number__lt='3000025').update(open_date=shared)
+        Ticket.objects.filter(number__gte='3000050').update(open_date=shared + timedelta(days=1))
+
+    def walk(self, params):
+        """ Ikuti 'next' dari ?cursor= kosong sampai habis; kembalikan number per halaman """
+        pages = []
+        response = self.client.get(self.URL, {**params, 'cursor': ''})
+        while True:
+            self.assertEqual(response.status_code, 200)
+            data = response.json()
+            self.assertNotIn('count', data)
+            pages.append([row['number'] for row in data['results']])
+            if data['next'] is None:
+                return pages
+            # Link berikutnya membawa filter, sort, dan page_size yang sama
+            query = parse_qs(urlsplit(data['next']).query)
+            self.assertEqual({name: query[name] for name in params}, {name: [str(v)] for name, v in params.items()})
+            response = self.client.get(data['next'])
+
+    def assertWalkMatches(self, params, queryset):
+        pages = self.walk({'page_size': 7, **params})
+        numbers = [number for page in pages for number in page]
+        self.assertEqual(numbers, list(queryset.values_list('number', flat=True)))
+        self.assertEqual(len(numbers), len(set(numbers)))
+        self.assertTrue(all(len(page) == 7 for page in pages[:-1]))
+
+    def test_walk_default_sort(self):
+        self.assertWalkMatches({}, Ticket.objects.order_by('-open_date', '-number'))
+
+    def test_walk_ascending_sort(self):
+        self.assertWalkMatches({'sort': 'open_date'}, Ticket.objects.order_by('open_date', 'number'))
+
+    def test_walk_keeps_filters(self):
+        expected = Ticket.objects.filter(priority='2 - High').order_by('open_date', 'number')
+        self.assertGreater(expected.count(), 7)
+        self.assertWalkMatches({'priority': '2 - High', 'sort': 'open_date'}, expected)
+
+    def test_page_number_pagination_without_cursor(self):
+        data = self.client.get(self.URL).json()
+        self.assertEqual(data['count'], 60)
+
+    def test_tampered_cursor_returns_404(self):
+        missing_key = base64.urlsafe_b64encode(b'{"d": "2025-01-01T00:00:00"}').decode('ascii')
+        for cursor in ('bukan-cursor', missing_key, 'eyJkIjogMX0='):
+            self.assertEqual(self.client.get(self.URL, {'cursor': cursor}).status_code, 404)
+
+
+@override_settings(TICKET_EXPORT_CHUNK_SIZE=7)  # Beberapa chunk stream untuk data uji kecil
+class TicketExportTests(TestCase):
+    URL = '/api/tickets/export/'
+    FILTERS = {'priority': '2 - High', 'is_sla_violated': 'false', 'sort': 'open_date'}
+
+    def setUp(self):
+        seed_tickets(80)
+
+    def listed_rows(self):
+        # Listing dengan filter yang sama, satu halaman cursor (urutan (open_date, number) seperti export)
+        data = self.client.get('/api/tickets/', {**self.FILTERS, 'cursor': '', 'page_size': 5000}).json()
+        self.assertIsNone(data['next'])
+        self.assertGreater(len(data['results']), 7)
+        return data['results']
+
+    def export(self, export_format):
+        response = self.client.get(self.URL, {**self.FILTERS, 'format': export_format})
+        self.assertEqual(response.status_code, 200)
+        self.assertRegex(
+            response['Content-Disposition'],
+            rf'^attachment; filename="tickets_\d{{8}}_\d{{6}}\.{export_format}"$',
+        )
+        return response, b''.join(response.streaming_content)
+
+    def test_csv_matches_filtered_list(self):
+        response, content = self.export('csv')
+        self.assertTrue(response['Content-Type'].startswith('text/csv'))
+        reader = csv.reader(io.StringIO(content.decode('utf-8')))
+        self.assertEqual(next(reader), [csv_col for csv_col, _, _ in COLUMN_MAP])
+        rows = [dict(zip([csv_col for csv_col, _, _ in COLUMN_MAP], row)) for row in reader]
+
+        listed = self.listed_rows()
+        self.assertEqual(
+            [(row['Number'], row['Priority'], row['Category'], row['Is SLA Violated']) for row in rows],
+            [(row['number'], row['priority'], row['category'], str(int(row['is_sla_violated']))) for row in listed],
+        )
+
+    @unittest.skipIf(pq is None, 'Export Parquet butuh pyarrow')
+    def test_parquet_matches_filtered_list(self):
+        response, content = self.export('parquet')
+        self.assertEqual(response['Content-Type'], 'application/vnd.apache.parquet')
+        table = pq.read_table(io.BytesIO(content))
+        self.assertEqual(table.column_names, [field for _, field, _ in COLUMN_MAP])
+
+        listed = self.listed_rows()
+        self.assertEqual(
+            list(zip(*(table.column(name).to_pylist() for name in ('number', 'priority', 'category', 'is_sla_violated')))),
+            [(row['number'], row['priority'], row['category'], row['is_sla_violated']) for row in listed],
+        )
+
+    def test_unknown_format_returns_404(self):
+        self.assertEqual(self.client.get(self.URL, {'format': 'xml'}).status_code, 404)
+
+
+class DashboardSummaryTests(TransactionTestCase):
+    """ TransactionTestCase: query bagian DB berjalan di thread lain, data uji harus sudah di-commit """
+    URL = '/api/dashboard/summary/?sections=stats,feature_importance,clusters'
+
+    def setUp(self):
+        analytics_cache.invalidate()
+
+    def test_failed_section_does_not_blank_others(self):
+        failing = mock.Mock(side_effect=FileNotFoundError('feature_importances.json'))
+        with mock.patch.dict(views.SUMMARY_LOCAL_SECTIONS, feature_importance=failing):
+            response = self.client.get(self.URL)
+        self.assertEqual(response.status_code, 200)
+        data = response.json()
+        self.assertEqual(set(data), {'stats', 'clusters', 'errors'})
+        self.assertEqual(set(data['errors']), {'feature_importance'})
+        self.assertEqual(response['Cache-Control'], 'no-store')
+
+        # Response dengan error tidak di-cache: request berikutnya mencoba lagi
+        with mock.patch.dict(views.SUMMARY_LOCAL_SECTIONS, feature_importance=lambda: []):
+            data = self.client.get(self.URL).json()
+        self.assertNotIn('errors', data)
+        self.assertEqual(data['feature_importance'], [])
+
+    def test_clusters_follow_cluster_files(self):
+        charts = mock.Mock(return_value={'num_clusters': 2})
+        with mock.patch.dict(views.SUMMARY_LOCAL_SECTIONS, clusters=charts, feature_importance=lambda: []), \
+                mock.patch.object(views.cluster_store, 'signature', return_value=(1,)):
+            first = self.client.get(self.URL)
+            self.assertEqual(self.client.get(self.URL, HTTP_IF_NONE_MATCH=first['ETag']).status_code, 304)
+            self.assertEqual(charts.call_count, 1)
+
+            # File cluster diganti (mtime berubah): summary tidak lagi dari cache
+            charts.return_value = {'num_clusters': 3}
+            views.cluster_store.signature.return_value = (2,)
+            data = self.client.get(self.URL).json()
+        self.assertEqual(data['clusters'], {'num_clusters': 3})
+
+    def test_feature_importance_follows_file(self):
+        path = os.path.join(tempfile.mkdtemp(), 'feature_importances.json')
+        self.addCleanup(os.remove, path)
+        url = '/api/stats/feature-importance/'
+        with mock.patch.object(views, 'FEATURE_IMPORTANCE_PATH', path):
+            with open(path, 'w') as f:
+                json.dump([{'feature': 'priority', 'importance': 0.5}], f)
+            self.assertEqual(self.client.get(url).json()[0]['feature'], 'priority')
+
+            # Notebook menulis ulang file: endpoint & summary tidak menunggu TTL cache
+            with open(path, 'w') as f:
+                json.dump([{'feature': 'category', 'importance': 0.7}], f)
+            stat = os.stat(path)
+            os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1000000))
+            self.assertEqual(self.client.get(url).json()[0]['feature'], 'category')
+            summary = self.client.get('/api/dashboard/summary/?sections=feature_importance').json()
+        self.assertEqual(summary['feature_importance'][0]['feature'], 'category')
+
+    def test_stats_section_uses_daily_rollup(self):
+        # Hanya ada di rollup (tabel Ticket kosong): dari tabel Ticket totalnya 0
+        for priority, count in (('1 - Critical', 5), ('4 - Low', 3)):
+            TicketDailyStat.objects.create(
+                day=date(2025, 1, 1), priority=priority, category='kategori 1', is_sla_violated=True,
+                ticket_count=count, resolution_duration_sum=count, compliance_rate_sum=0,
+            )
+        filters = {'priority': '1 - Critical'}
+        self.assertEqual(self.client.get('/api/stats/', filters).json()['total_tickets'], 5)
+        summary = self.client.get('/api/dashboard/summary/', {'sections': 'stats', **filters}).json()
+        self.assertEqual(summary['stats']['total_tickets'], 5)
@@ -2,8 +2,10 @@ from django.urls import include, path
 from rest_framework.routers import DefaultRouter
 
 from .views import (TicketViewSet, get_clusters,  # Tambah import
-                    get_feature_importance, get_monthly_trend, get_stats,
-                    get_unique_values, get_violation_by_category, predict_sla)
+                    get_dashboard_summary, get_feature_importance,
+                    get_monthly_trend, get_prediction_cache_stats, get_stats,
+                    get_unique_values, get_violation_by_category, predict_sla,
+                    predict_sla_batch)
 
 router = DefaultRouter()
 router.register(r'tickets', TicketViewSet)  # /api/tickets/ untuk list
@@ -12,9 +14,12 @@ urlpatterns = [
     path('', include(router.urls)),
     path('stats/', get_stats, name='stats'),  # /api/stats/ untuk stats
     path('predict/', predict_sla, name='predict_sla'),  
+    path('predict/batch/', predict_sla_batch, name='predict_sla_batch'),
+    path('predict/cache-stats/', get_prediction_cache_stats, name='prediction_cache_stats'),
     path('unique-values/', get_unique_values, name='unique_values'),
     path('stats/violation-by-category/', get_violation_by_category, name='violation_by_category'),
     path('stats/monthly-trend/', get_monthly_trend, name='monthly_trend'), # Tambah URL ini
     path('stats/feature-importance/', get_feature_importance, name='feature_importance'),
     path('clusters/', get_clusters, name='clusters'),  # Baru
+    path('dashboard/summary/', get_dashboard_summary, name='dashboard_summary'),
 ]
\ No newline at end of file
@@ -0,0 +1,365 @@
+import json
+import os
+import threading
+from collections import OrderedDict
+
+import numpy as np
+
+# Fallback sample data (jika file tidak ada)
+EMPTY_CLUSTER_DATA = {
+    'num_clusters': 0,
+    'summary_per_cluster': {},
+    'pca_coords': [],
+    'cluster_labels': [],
+    'numerical_columns_summary': [],
+    'categorical_columns_summary': [],
+}
+
+# Format biner dari Model/k_proto.py (BAGIAN 8), dicari di folder yang sama dengan cluster_results.json
+SUMMARY_FILE = 'cluster_summary.json'
+LABELS_FILE = 'cluster_labels.npy'
+COORDS_FILE = 'cluster_pca_coords.npy'
+SAMPLE_IDX_FILE = 'cluster_sample_idx.npy'
+
+# Baris per chunk saat memindai seluruh memmap (histogram), supaya memori tetap kecil
+CHUNK_ROWS = 1000000
+
+
+def stratified_sample_index(coords, labels, num_clusters, max_points=20000, grid_size=32,
+                            candidate_limit=200000, seed=42):
+    """
+    Urutan sampel per cluster: titik dikelompokkan ke grid grid_size x grid_size
+    (bounding box cluster itu sendiri), lalu diambil bergiliran satu per sel,
+    dengan urutan acak (seeded) di dalam sel dan di setiap putaran.
+    Sel padat tidak mendominasi, outlier di sel jarang tetap ikut.
+
+    Hasil: (sample_idx, offsets, sizes). sample_idx[offsets[c]:offsets[c + 1]] = indeks titik
+    cluster c (paling banyak max_points) dalam urutan sampel; sizes = jumlah titik per cluster.
+    Membaca semua label, jadi dijalankan sekali saat ekspor (Model/k_proto.py BAGIAN 8
+    -> cluster_sample_idx.npy), atau saat load untuk fallback cluster_results.json.
+    Tidak bergantung pada Django supaya bisa diimpor skrip Model/.
+    """
+    rng = np.random.default_rng(seed)
+    all_labels = np.asarray(labels, dtype=np.int64)
+    order = np.argsort(all_labels, kind='stable')
+    bounds = np.searchsorted(all_labels[order], np.arange(num_clusters + 1))
+    sizes = np.diff(bounds)
+
+    samples = []
+    for cluster_id in range(num_clusters):
+        idx = order[bounds[cluster_id]:bounds[cluster_id + 1]]
+        if len(idx) > candidate_limit:
+            idx = rng.choice(idx, candidate_limit, replace=False)
+        idx = np.sort(idx)  # Baca memmap secara berurutan
+        if len(idx) == 0:
+            samples.append(idx)
+            continue
+        pts = np.asarray(coords[idx, :2], dtype=np.float64)
+
+        low = pts.min(axis=0)
+        span = np.maximum(pts.max(axis=0) - low, 1e-12)
+        cell_xy = np.minimum(((pts - low) / span * grid_size).astype(np.int64), grid_size - 1)
+        cells = cell_xy[:, 0] * grid_size + cell_xy[:, 1]
+
+        # Peringkat acak di dalam sel: 0 untuk titik pertama tiap sel, 1 untuk kedua, dst.
+        perm = rng.permutation(len(pts))
+        by_cell = perm[np.argsort(cells[perm], kind='stable')]
+        sorted_cells = cells[by_cell]
+        first = np.searchsorted(sorted_cells, sorted_cells, side='left')
+        rank = np.empty(len(pts), dtype=np.float64)
+        rank[by_cell] = np.arange(len(pts)) - first
+
+        # Putaran demi putaran; urutan sel dalam satu putaran diacak lewat pecahan
+        ordered = np.argsort(rank + rng.random(len(pts)), kind='stable')
+        samples.append(idx[ordered[:max_points]])
+
+    offsets = np.concatenate([[0], np.cumsum([len(sample) for sample in samples])]).astype(np.int64)
+    sample_idx = np.concatenate(samples).astype(np.int64) if samples else np.empty(0, dtype=np.int64)
+    return sample_idx, offsets, sizes
+
+
+class ClusterStore:
+    """
+    Memuat hasil clustering sekali dan menyimpan payload 'charts' yang sudah jadi.
+    File dibaca ulang hanya jika mtime-nya berubah.
+
+    Jika ada format biner (cluster_summary.json + .npy), array per tiket dibuka
+    dengan mmap_mode='r' sehingga tidak dimuat penuh ke memori; jika tidak,
+    fallback ke cluster_results.json.
+
+    Setiap cluster punya urutan sampel bertingkat (stratified) yang sadar kepadatan
+    (lihat stratified_sample_index): prefix sepanjang apa pun tersebar merata dan
+    cluster kecil tetap terlihat. Di format biner urutan ini sudah dihitung saat ekspor
+    (cluster_sample_idx.npy, di-mmap), jadi biaya load tidak bergantung jumlah tiket.
+    Scatter diminta lewat get_charts(points=N), histogram 2D lewat mode='hist'.
+    """
+    def __init__(self, json_path, sample_limit=1000, max_points=20000, grid_size=32,
+                 candidate_limit=200000, max_bins=256, seed=42):
+        self.json_path = json_path
+        directory = os.path.dirname(json_path)
+        self.summary_path = os.path.join(directory, SUMMARY_FILE)
+        self.labels_path = os.path.join(directory, LABELS_FILE)
+        self.coords_path = os.path.join(directory, COORDS_FILE)
+        self.sample_idx_path = os.path.join(directory, SAMPLE_IDX_FILE)
+        self.sample_limit = sample_limit          # Default ?points=
+        self.max_points = max_points              # Sampel tersimpan per cluster
+        self.grid_size = grid_size                # Grid stratifikasi per cluster
+        self.candidate_limit = candidate_limit    # Titik yang dibaca per cluster saat stratifikasi
+        self.max_bins = max_bins
+        self.seed = seed
+        self._lock = threading.Lock()
+        self._mtime = None
+        self._state = None
+
+    def signature(self):
+        """ mtime file hasil clustering; berubah jika ada file yang diganti """
+        signature = []
+        for path in (self.summary_path, self.labels_path, self.coords_path, self.sample_idx_path, self.json_path):
+            try:
+                signature.append(os.stat(path).st_mtime_ns)
+            except OSError:
+                signature.append(None)
+        return tuple(signature)
+
+    def _has_binary(self):
+        return all(os.path.exists(path) for path in (self.summary_path, self.labels_path, self.coords_path))
+
+    def get_charts(self, points=None, mode='scatter', bins=64):
+        """
+        Payload 'charts' untuk /api/clusters/ (di-cache per parameter sampai file berubah).
+        mode='scatter': sampel bertingkat sebanyak points titik (default sample_limit).
+        mode='hist': pca_scatter diganti pca_hist, histogram 2D bins x bins per cluster.
+        """
+        state = self._get_state()
+        if mode == 'hist':
+            key = ('hist', min(max(int(bins), 1), self.max_bins))
+        else:
+            key = ('scatter', max(int(points if points is not None else self.sample_limit), 1))
+
+        with state['lock']:
+            charts = state['charts'].get(key)
+            if charts is not None:
+                state['charts'].move_to_end(key)
+                return charts
+
+        if key[0] == 'hist':
+            charts = {'pca_scatter': None, 'pca_hist': self._build_histogram(state, key[1])}
+        else:
+            charts = {'pca_scatter': self._build_scatter(state, key[1])}
+        charts.update(state['base_charts'])
+
+        with state['lock']:
+            state['charts'][key] = charts
+            while len(state['charts']) > 32:
+                state['charts'].popitem(last=False)
+        return charts
+
+    def _get_state(self):
+        mtime = self.signature()
+        if self._state is not None and mtime == self._mtime:
+            return self._state
+        with self._lock:
+            if self._state is None or mtime != self._mtime:
+                self._state = self._prepare(self._load())
+                self._mtime = mtime
+        return self._state
+
+    def _load(self):
+        # Load data
+        try:
+            if self._has_binary():
+                with open(self.summary_path, 'r') as f:
+                    data = json.load(f)
+                data['cluster_labels'] = np.load(self.labels_path, mmap_mode='r')
+                data['pca_coords'] = np.load(self.coords_path, mmap_mode='r')
+                if os.path.exists(self.sample_idx_path) and 'sample_offsets' in data:
+                    data['sample_idx'] = np.load(self.sample_idx_path, mmap_mode='r')
+                else:
+                    print(f"{SAMPLE_IDX_FILE} tidak ada: sampel dihitung saat load (ekspor ulang k_proto.py BAGIAN 8).")
+                print("Cluster binary (.npy) loaded with mmap.")
+            elif os.path.exists(self.json_path):
+                with open(self.json_path, 'r') as f:
+                    data = json.load(f)
+                print("Cluster JSON loaded from file.")
+            else:
+                data = EMPTY_CLUSTER_DATA
+                print("Using sample data (cluster_results.json not found).")
+        except Exception as e:
+            print(f"Load error: {e}")
+            data = EMPTY_CLUSTER_DATA
+        return data
+
+    def _prepare(self, data):
+        """ Bangun chart statis dan sampel bertingkat per cluster, sekali per versi file """
+        num_clusters = data.get('num_clusters', 0)
+        pca_coords = data.get('pca_coords', [])
+        cluster_labels = data.get('cluster_labels', [])
+
+        state = {
+            'lock': threading.Lock(),
+            'charts': OrderedDict(),
+            'base_charts': self._build_base_charts(data),
+            'num_clusters': num_clusters,
+            'labels': None,
+            'coords': None,
+            'sample_idx': None,
+            'sample_offsets': None,
+            'sizes': None,
+            'hist_extent': None,
+        }
+        if len(pca_coords) and len(cluster_labels) and len(pca_coords) == len(cluster_labels) and num_clusters > 0:
+            # memmap dibiarkan apa adanya; list dari JSON dikonversi sekali
+            coords = pca_coords if isinstance(pca_coords, np.ndarray) else np.asarray(pca_coords, dtype=np.float64)
+            labels = cluster_labels if isinstance(cluster_labels, np.ndarray) else np.asarray(cluster_labels)
+            state['coords'] = coords
+            state['labels'] = labels
+            if 'sample_idx' in data:
+                # Dari ekspor: tanpa membaca label/koordinat semua tiket
+                state['sample_idx'] = data['sample_idx']
+                state['sample_offsets'] = np.asarray(data['sample_offsets'], dtype=np.int64)
+                state['sizes'] = np.asarray(data['cluster_sizes'], dtype=np.int64)
+            else:
+                state['sample_idx'], state['sample_offsets'], state['sizes'] = stratified_sample_index(
+                    coords, labels, num_clusters, max_points=self.max_points, grid_size=self.grid_size,
+                    candidate_limit=self.candidate_limit, seed=self.seed,
+                )
+        return state
+
+    def _allocate(self, sizes, available, points):
+        """
+        Bagi kuota titik ke setiap cluster: separuh dibagi rata (minimal 1 per cluster),
+        sisanya proporsional ukuran cluster, dibatasi jumlah sampel yang tersedia.
+        """
+        num_clusters = len(sizes)
+        quota = np.minimum(available, max(points // (2 * num_clusters), 1))
+        for _ in range(num_clusters + 1):
+            remaining = points - int(quota.sum())
+            capacity = available - quota
+            if remaining <= 0 or capacity.sum() == 0:
+                break
+            weights = np.where(capacity > 0, sizes, 0).astype(np.float64)
+            if weights.sum() == 0:
+                weights = (capacity > 0).astype(np.float64)
+            extra = np.minimum(capacity, np.floor(remaining * weights / weights.sum()).astype(np.int64))
+            if extra.sum() == 0:
+                # Sisa pembulatan: satu titik untuk cluster terbesar yang masih punya kapasitas
+                extra[np.argsort(-weights, kind='stable')[:remaining]] = 1
+                extra = np.minimum(extra, capacity)
+            quota = quota + extra
+        return quota
+
+    def _build_scatter(self, state, points):
+        # 1. PCA Scatter Chart Data
+        if state['sample_idx'] is None:
+            return None
+        num_clusters = state['num_clusters']
+        offsets = state['sample_offsets']
+        quota = self._allocate(state['sizes'], np.diff(offsets), points)
+
+        pca_datasets = []
+        for cluster_id in range(num_clusters):
+            idx = np.asarray(state['sample_idx'][offsets[cluster_id]:offsets[cluster_id] + quota[cluster_id]])
+            pts = np.asarray(state['coords'][idx, :2], dtype=np.float64) if len(idx) else np.empty((0, 2))
+            pca_datasets.append({
+                'label': f'Cluster {cluster_id}',
+                'data': [{'x': x, 'y': y} for x, y in pts.tolist()],
+                'backgroundColor': f'hsl({cluster_id * (360 / num_clusters)}, 70%, 50%)',
+                'pointRadius': 3,
+            })
+        return {'datasets': pca_datasets}
+
+    def _hist_extent(self, state):
+        """ Bounding box seluruh titik, dihitung per chunk sekali per versi file """
+        if state['hist_extent'] is None:
+            coords = state['coords']
+            low = np.full(2, np.inf)
+            high = np.full(2, -np.inf)
+            for start in range(0, len(coords), CHUNK_ROWS):
+                chunk = np.asarray(coords[start:start + CHUNK_ROWS, :2], dtype=np.float64)
+                low = np.minimum(low, chunk.min(axis=0))
+                high = np.maximum(high, chunk.max(axis=0))
+            state['hist_extent'] = (low, high)
+        return state['hist_extent']
+
+    def _build_histogram(self, state, bins):
+        """
+        Histogram 2D per cluster di atas grid bins x bins yang sama untuk semua cluster.
+        Semua titik dihitung (per chunk), ukuran payload hanya bergantung pada bins.
+        """
+        if state['sample_idx'] is None:
+            return None
+        num_clusters = state['num_clusters']
+        coords = state['coords']
+        labels = state['labels']
+        low, high = self._hist_extent(state)
+        span = np.maximum(high - low, 1e-12)
+
+        counts = np.zeros(num_clusters * bins * bins, dtype=np.int64)
+        for start in range(0, len(coords), CHUNK_ROWS):
+            chunk = np.asarray(coords[start:start + CHUNK_ROWS, :2], dtype=np.float64)
+            chunk_labels = np.asarray(labels[start:start + CHUNK_ROWS], dtype=np.int64)
+            cell_xy = np.minimum(((chunk - low) / span * bins).astype(np.int64), bins - 1)
+            keys = (chunk_labels * bins + cell_xy[:, 0]) * bins + cell_xy[:, 1]
+            counts += np.bincount(keys, minlength=len(counts))[:len(counts)]
+        counts = counts.reshape(num_clusters, bins, bins)
+
+        return {
+            'bins': bins,
+            'x_edges': np.linspace(low[0], high[0], bins + 1).tolist(),
+            'y_edges': np.linspace(low[1], high[1], bins + 1).tolist(),
+            'datasets': [{
+                'label': f'Cluster {cluster_id}',
+                'counts': counts[cluster_id].tolist(),  # counts[ix][iy]
+                'backgroundColor': f'hsl({cluster_id * (360 / num_clusters)}, 70%, 50%)',
+            } for cluster_id in range(num_clusters)],
+        }
+
+    def _build_base_charts(self, data):
+        # --- Mulai Membangun 'charts' (bagian yang tidak bergantung pada ?points=) ---
+        charts = {}
+        num_clusters = data.get('num_clusters', 0)
+        summary = data.get('summary_per_cluster', {})
+        numerical_cols = data.get('numerical_columns_summary', [])
+
+        # 2. Mean Bar Chart Data (warna acak tapi seeded, jadi response yang di-cache tetap deterministik)
+        color_rng = np.random.default_rng(self.seed)
+        bar_chart_datasets = []
+        if summary and numerical_cols and num_clusters > 0:
+            for num_col in numerical_cols:
+                dataset = {
+                    'label': num_col,
+                    'data': [summary.get(str(i), {}).get('mean_numerical', {}).get(num_col, None) for i in range(num_clusters)],
+                    'backgroundColor': f'hsl({int(color_rng.integers(0, 360))}, 60%, 60%)',
+                }
+                bar_chart_datasets.append(dataset)
+
+        charts['mean_bar'] = {
+            'labels': [f'Cluster {i}' for i in range(num_clusters)],
+            'datasets': bar_chart_datasets,
+        }
+
+        # 3. Cluster Size Pie Chart Data
+        pie_charts_data = {}
+        if summary and num_clusters > 0:
+            pie_labels = []
+            cluster_sizes = []
+
+            for i in range(num_clusters):
+                cluster_summary = summary.get(str(i), {})
+                # Ambil mode 'Priority' untuk label
+                mode_value = cluster_summary.get('mode_categorical', {}).get('Priority', 'Unknown')
+                pie_labels.append(f"Cluster {i} ({mode_value})")
+                cluster_sizes.append(cluster_summary.get('size', 0))
+
+            background_colors = [f'hsl({i * (360 / num_clusters)}, 70%, 50%)' for i in range(num_clusters)]
+
+            pie_charts_data = {
+                'labels': pie_labels,
+                'datasets': [{
+                    'data': cluster_sizes,
+                    'backgroundColor': background_colors,
+                }],
+            }
+
+        charts['cluster_size_pie'] = pie_charts_data
+        return charts
@@ -0,0 +1,85 @@
+from contextlib import contextmanager
+
+from django.db import connection, transaction
+from django.db.models import Count, Sum
+from django.db.models.functions import TruncDate
+
+from tickets.models import Ticket, TicketDailyStat
+
+# Kunci rollup TicketDailyStat; 'day' = TruncDate(open_date) pada TIME_ZONE
+KEY_FIELDS = ('day', 'priority', 'category', 'is_sla_violated')
+SUM_FIELDS = ('ticket_count', 'resolution_duration_sum', 'compliance_rate_sum')
+
+
+def aggregate_tickets(queryset):
+    """ {(day, priority, category, is_sla_violated): [count, sum durasi, sum compliance]} dari queryset Ticket """
+    rows = queryset.order_by().annotate(day=TruncDate('open_date')).values(*KEY_FIELDS).annotate(
+        ticket_count=Count('number'),
+        resolution_duration_sum=Sum('resolution_duration'),
+        compliance_rate_sum=Sum('application_sla_compliance_rate'),
+    )
+    return {
+        tuple(row[field] for field in KEY_FIELDS): [row[field] or 0 for field in SUM_FIELDS]
+        for row in rows
+    }
+
+
+def apply_delta(delta):
+    """
+    Tambahkan selisih {kunci: [count, sum durasi, sum compliance]} ke rollup dengan
+    INSERT ... ON CONFLICT DO UPDATE SET kolom = kolom + EXCLUDED.kolom, jadi import
+    yang berjalan bersamaan tidak saling menimpa. Baris yang count-nya habis dihapus.
+    """
+    rows = [key + tuple(values) for key, values in delta.items() if any(values)]
+    if not rows:
+        return
+
+    qn = connection.ops.quote_name
+    table = qn(TicketDailyStat._meta.db_table)
+    columns = ', '.join(qn(field) for field in KEY_FIELDS + SUM_FIELDS)
+    placeholders = ', '.join(['%s'] * len(KEY_FIELDS + SUM_FIELDS))
+    conflict = ', '.join(qn(field) for field in KEY_FIELDS)
+    updates = ', '.join(f'{qn(field)} = {table}.{qn(field)} + EXCLUDED.{qn(field)}' for field in SUM_FIELDS)
+
+    with transaction.atomic(), connection.cursor() as cursor:
+        cursor.executemany(
+            f'INSERT INTO {table} ({columns}) VALUES ({placeholders}) '
+            f'ON CONFLICT ({conflict}) DO UPDATE SET {updates}',
+            rows,
+        )
+        TicketDailyStat.objects.filter(day__in={row[0] for row in rows}, ticket_count__lte=0).delete()
+
+
+@contextmanager
+def track_ticket_changes(numbers):
+    """
+    Perbarui rollup untuk tiket `numbers` yang di-insert/di-upsert di dalam blok:
+    agregat sesudah dikurangi agregat sebelum (tiket lama yang ditimpa ikut dikoreksi).
+    Panggil di dalam transaction.atomic() yang sama dengan penulisan tiket.
+    """
+    numbers = list(numbers)
+    before = aggregate_tickets(Ticket.objects.filter(number__in=numbers))
+    yield
+    after = aggregate_tickets(Ticket.objects.filter(number__in=numbers))
+
+    delta = {key: list(values) for key, values in after.items()}
+    for key, values in before.items():
+        current = delta.setdefault(key, [0, 0.0, 0.0])
+        for i, value in enumerate(values):
+            current[i] -= value
+    apply_delta(delta)
+
+
+def rebuild_daily_stats(batch_size=5000):
+    """ Hitung ulang seluruh rollup dari tabel Ticket (manage.py rebuild_ticket_stats) """
+    aggregates = aggregate_tickets(Ticket.objects.all())
+    with transaction.atomic():
+        TicketDailyStat.objects.all().delete()
+        TicketDailyStat.objects.bulk_create(
+            [
+                TicketDailyStat(**dict(zip(KEY_FIELDS, key)), **dict(zip(SUM_FIELDS, values)))
+                for key, values in aggregates.items()
+            ],
+            batch_size=batch_size,
+        )
+    return len(aggregates)
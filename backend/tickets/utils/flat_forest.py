@@ -0,0 +1,105 @@
+import numpy as np
+
+# Node daun di sklearn: children_left == children_right == TREE_LEAF (-1)
+TREE_LEAF = -1
+
+
+class FlatForest:
+    """
+    RandomForestClassifier yang diratakan ke array NumPy kontigu (feature, threshold,
+    left, value) untuk semua pohon, dievaluasi per level untuk seluruh batch:
+    setiap iterasi memajukan semua pasangan (pohon, baris) satu level sekaligus.
+
+    Node setiap pohon diurutkan ulang secara BFS sehingga anak kanan selalu
+    left + 1; daun menunjuk ke dirinya sendiri dengan threshold +inf, jadi baris
+    yang sudah sampai daun diam di sana sampai level terakhir (max_depth).
+
+    Hasil predict_proba bit-identik dengan sklearn (n_jobs=None): X di-cast ke float32
+    seperti sklearn, daun memakai tree_.value (sudah berupa proporsi kelas sejak
+    scikit-learn 1.4), dan probabilitas dijumlahkan per pohon dengan urutan yang sama
+    lalu dibagi jumlah pohon.
+    """
+    def __init__(self, model, chunk_size=256):
+        if getattr(model, 'n_outputs_', 1) != 1:
+            raise ValueError('FlatForest hanya mendukung model dengan satu output.')
+        self.classes_ = model.classes_
+        self.n_classes = len(model.classes_)
+        self.n_features_in_ = model.n_features_in_
+        self.n_trees = len(model.estimators_)
+        self.chunk_size = chunk_size
+
+        features, thresholds, lefts, values, roots = [], [], [], [], []
+        offset = 0
+        for estimator in model.estimators_:
+            feature, threshold, left, value = self._flatten_tree(estimator.tree_)
+            features.append(feature)
+            thresholds.append(threshold)
+            lefts.append(left + offset)
+            values.append(value)
+            roots.append(offset)
+            offset += len(feature)
+
+        self.feature = np.ascontiguousarray(np.concatenate(features), dtype=np.intp)
+        self.threshold = np.ascontiguousarray(np.concatenate(thresholds), dtype=np.float64)
+        self.left = np.ascontiguousarray(np.concatenate(lefts), dtype=np.intp)
+        self.value = np.ascontiguousarray(np.concatenate(values), dtype=np.float64)
+        self.roots = np.array(roots, dtype=np.intp)
+        self.max_depth = max(estimator.tree_.max_depth for estimator in model.estimators_)
+
+    def _flatten_tree(self, tree):
+        """ Urutan BFS satu pohon: anak-anak setiap node internal bersebelahan (kiri, kanan) """
+        children_left = tree.children_left
+        children_right = tree.children_right
+
+        levels = []
+        level = np.array([0], dtype=np.intp)
+        while len(level):
+            levels.append(level)
+            internal = level[children_left[level] != TREE_LEAF]
+            level = np.column_stack((children_left[internal], children_right[internal])).ravel()
+        order = np.concatenate(levels)  # order[indeks_baru] = indeks_lama
+
+        new_index = np.empty(tree.node_count, dtype=np.intp)
+        new_index[order] = np.arange(len(order))
+        is_leaf = children_left[order] == TREE_LEAF
+
+        feature = np.where(is_leaf, 0, tree.feature[order])
+        threshold = np.where(is_leaf, np.inf, tree.threshold[order])
+        left = np.where(is_leaf, np.arange(len(order)), new_index[np.where(is_leaf, 0, children_left[order])])
+        value = tree.value[order, 0, :self.n_classes]
+        return feature, threshold, left, value
+
+    def apply(self, X):
+        """ Indeks node daun (global) untuk setiap pohon x baris, shape (n_trees, n_samples) """
+        # Sama dengan validasi sklearn: fitur dibandingkan dalam float32
+        X = np.ascontiguousarray(X, dtype=np.float32)
+        n_samples, n_features = X.shape
+        flat_X = X.ravel()
+        row_offset = (np.arange(n_samples, dtype=np.intp) * n_features)[np.newaxis, :]
+
+        nodes = np.repeat(self.roots[:, np.newaxis], n_samples, axis=1)
+        for _ in range(self.max_depth):
+            x = np.take(flat_X, np.take(self.feature, nodes) + row_offset)
+            # x > threshold -> anak kanan (left + 1); sklearn: x <= threshold -> kiri
+            nodes = np.take(self.left, nodes) + (x > np.take(self.threshold, nodes))
+        return nodes
+
+    def predict_proba(self, X):
+        X = np.asarray(X)
+        if X.ndim != 2 or X.shape[1] != self.n_features_in_:
+            raise ValueError(f'X harus berukuran (n, {self.n_features_in_}), bukan {X.shape}.')
+        if np.isnan(X).any():
+            raise ValueError('FlatForest tidak mendukung nilai NaN.')
+
+        proba = np.zeros((X.shape[0], self.n_classes), dtype=np.float64)
+        for start in range(0, X.shape[0], self.chunk_size):
+            leaves = self.apply(X[start:start + self.chunk_size])
+            out = proba[start:start + self.chunk_size]
+            # Akumulasi berurutan per pohon, sama dengan ForestClassifier.predict_proba
+            for tree_leaves in leaves:
+                out += np.take(self.value, tree_leaves, axis=0)
+        proba /= self.n_trees
+        return proba
+
+    def predict(self, X):
+        return self.classes_[np.argmax(self.predict_proba(X), axis=1)]
@@ -0,0 +1,121 @@
+import atexit
+import queue
+import threading
+import time
+
+from django.db import close_old_connections, connection
+
+
+class PredictionLogWriter:
+    """
+    Penulis PredictionLog ter-buffer: entri diantrikan di memori lalu ditulis
+    dengan bulk_create oleh thread latar belakang, jadi insert ke Postgres
+    tidak menambah latensi request prediksi.
+
+    Flush terjadi jika buffer mencapai batch_size atau setelah flush_interval detik.
+    Antrian dibatasi (max_queue); jika penuh, entri dibuang dan dihitung di 'dropped'.
+    Batch yang gagal di-bulk_create dihitung di 'failed', jadi setiap entri yang
+    masuk log() tercatat di queued, written, dropped, atau failed.
+    Sisa antrian di-flush saat proses berhenti (atexit).
+    """
+    def __init__(self, batch_size=500, flush_interval=1.0, max_queue=10000, enqueue_timeout=0.05):
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.enqueue_timeout = enqueue_timeout
+        self.written = 0
+        self.dropped = 0
+        self.failed = 0  # Hanya diubah thread writer, seperti written
+        self._queue = queue.Queue(maxsize=max_queue)
+        self._stop = threading.Event()
+        self._thread = None
+        self._start_lock = threading.Lock()
+        self._dropped_lock = threading.Lock()  # log() dipanggil dari banyak thread request
+
+    def log(self, **fields):
+        """ Antrikan satu PredictionLog (field sama seperti PredictionLog.objects.create) """
+        self._ensure_started()
+        try:
+            self._queue.put(fields, timeout=self.enqueue_timeout)
+        except queue.Full:
+            with self._dropped_lock:
+                self.dropped += 1
+                dropped = self.dropped
+            if dropped % 1000 == 1:
+                print(f"WARNING: Antrian PredictionLog penuh, {dropped} log dibuang.")
+
+    def stats(self):
+        return {
+            'queued': self._queue.qsize(),
+            'written': self.written,
+            'dropped': self.dropped,
+            'failed': self.failed,
+        }
+
+    def _ensure_started(self):
+        # Thread baru dibuat saat log pertama, bukan saat import (migrate, shell, dll.)
+        if self._thread is not None:
+            return
+        with self._start_lock:
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name='prediction-log-writer', daemon=True)
+                self._thread.start()
+                atexit.register(self.shutdown)
+
+    def _run(self):
+        try:
+            while not self._stop.is_set():
+                batch = self._collect_batch()
+                if batch:
+                    self._flush(batch)
+            # Drain: tulis semua yang masih tersisa di antrian
+            while True:
+                batch = self._drain(self.batch_size)
+                if not batch:
+                    break
+                self._flush(batch)
+        finally:
+            connection.close()
+
+    def _collect_batch(self):
+        """ Tunggu sampai batch_size entri terkumpul atau flush_interval habis """
+        batch = []
+        deadline = time.monotonic() + self.flush_interval
+        while len(batch) < self.batch_size and not self._stop.is_set():
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(self._queue.get(timeout=remaining))
+            except queue.Empty:
+                break
+            batch.extend(self._drain(self.batch_size - len(batch)))
+        return batch
+
+    def _drain(self, limit):
+        items = []
+        while len(items) < limit:
+            try:
+                items.append(self._queue.get_nowait())
+            except queue.Empty:
+                break
+        return items
+
+    def _flush(self, batch):
+        from tickets.models import PredictionLog
+
+        close_old_connections()
+        try:
+            PredictionLog.objects.bulk_create(
+                [PredictionLog(**fields) for fields in batch],
+                batch_size=self.batch_size,
+            )
+            self.written += len(batch)
+        except Exception as e:
+            self.failed += len(batch)
+            print(f"ERROR saat menulis {len(batch)} PredictionLog: {type(e).__name__}: {e}")
+
+    def shutdown(self, timeout=10):
+        """ Hentikan thread dan tunggu sisa antrian selesai ditulis """
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
@@ -0,0 +1,158 @@
+import threading
+import time
+from datetime import datetime
+
+# Payload contoh untuk smoke prediction sebelum versi baru dipakai
+SMOKE_INPUT = {
+    'priority': '3 - Medium',
+    'category': 'kegagalan proses',
+    'item': 'application 84',
+    'sub_category': '',
+    'open_date': '2025-03-14T09:30',
+    'due_date': '2025-03-18T17:00',
+}
+
+
+class ModelRegistry:
+    """
+    Registry versi SLAPredictor dengan hot reload tanpa restart proses.
+
+    Jika file .pkl di disk berubah (dan sudah stabil selama satu interval cek),
+    versi baru dimuat di thread latar belakang, divalidasi dengan smoke prediction,
+    lalu referensinya ditukar secara atomik. Request yang sedang berjalan tetap
+    memakai predictor yang sudah diambilnya lewat get().
+
+    Hanya satu reload berjalan pada satu waktu, jadi paling banyak dua versi
+    yang resident: versi aktif dan kandidat yang sedang dimuat.
+
+    Versi pertama dimuat lazy saat get() pertama (atau lewat warm_up()), bukan
+    saat import, jadi migrate/import_tickets/test tidak ikut memuat model.
+    """
+    # Seberapa sering (detik) mtime file .pkl dicek
+    CHECK_INTERVAL = 2
+
+    def __init__(self, on_reload=None, **predictor_kwargs):
+        self.predictor_kwargs = predictor_kwargs
+        self.on_reload = on_reload  # Dipanggil setelah hot reload berhasil (mis. invalidasi cache)
+        self.version = 0
+        self.loaded_at = None
+        self.last_error = None
+        self._lock = threading.Lock()
+        self._init_lock = threading.Lock()
+        self._loading = False
+        self._pending_signature = None
+        self._failed_signature = None
+        self._checked_at = time.monotonic()
+        self._current = None
+
+    def get(self):
+        """ Predictor versi aktif; simpan di variabel lokal selama satu request """
+        if self._current is None:
+            return self.warm_up()
+        self._maybe_reload()
+        return self._current
+
+    def warm_up(self):
+        """ Muat versi pertama sekarang (thread-safe, hanya sekali); dipanggil worker sebelum menerima request """
+        if self._current is None:
+            with self._init_lock:
+                if self._current is None:
+                    self._swap(self._load())
+        return self._current
+
+    @property
+    def loaded(self):
+        return self._current is not None
+
+    def reload(self, wait=False):
+        """ Paksa reload dari disk; wait=True menunggu sampai selesai. False jika reload lain sedang berjalan """
+        if self._current is None:
+            self.warm_up()
+            return True
+        thread = self._start_reload()
+        if thread is None:
+            return False
+        if wait:
+            thread.join()
+        return True
+
+    def info(self):
+        return {
+            'version': self.version,
+            'loaded': self.loaded,
+            'loaded_at': self.loaded_at,
+            'loading': self._loading,
+            'last_error': self.last_error,
+        }
+
+    def _maybe_reload(self):
+        now = time.monotonic()
+        if self._loading or now - self._checked_at < self.CHECK_INTERVAL:
+            return
+        self._checked_at = now
+        signature = self._current.read_artifact_signature()
+        if signature == self._current.artifact_signature or signature == self._failed_signature:
+            self._pending_signature = None
+            return
+        # Tunggu sampai signature sama pada dua cek berturut-turut (file selesai disalin)
+        if signature != self._pending_signature:
+            self._pending_signature = signature
+            return
+        self._start_reload()
+
+    def _start_reload(self):
+        with self._lock:
+            if self._loading:
+                return None
+            self._loading = True
+        thread = threading.Thread(target=self._reload, name='model-reload', daemon=True)
+        thread.start()
+        return thread
+
+    def _reload(self):
+        try:
+            candidate = self._load()
+            if candidate.read_artifact_signature() != candidate.artifact_signature:
+                raise RuntimeError('File artefak berubah selama dimuat')
+            self._swap(candidate)
+            print(f"Model versi {self.version} aktif (hot reload).")
+        except Exception as e:
+            self.last_error = f'{type(e).__name__}: {e}'
+            self._failed_signature = self._current.read_artifact_signature()
+            print(f"ERROR hot reload model, versi {self.version} tetap dipakai: {self.last_error}")
+        else:
+            self._notify_reload()
+        finally:
+            self._pending_signature = None
+            self._loading = False
+
+    def _notify_reload(self):
+        if self.on_reload is None:
+            return
+        try:
+            self.on_reload()
+        except Exception as e:
+            # Versi baru sudah aktif; kegagalan callback tidak membatalkan reload
+            print(f"ERROR on_reload setelah hot reload: {type(e).__name__}: {e}")
+
+    def _load(self):
+        """ Muat bundle artefak baru dan validasi dengan smoke prediction """
+        # Import di sini: pandas/holidays/sklearn baru dimuat saat model benar-benar dipakai
+        from .model_utils import SLAPredictor
+
+        candidate = SLAPredictor(**self.predictor_kwargs)
+        result = candidate.predict(SMOKE_INPUT, use_cache=False)
+        if result.get('status') != 'sukses':
+            raise RuntimeError(f"Smoke prediction gagal: {result.get('message')}")
+        if not 0 <= result['confidence'] <= 100:
+            raise RuntimeError(f"Smoke prediction tidak valid: confidence={result['confidence']}")
+        return candidate
+
+    def _swap(self, predictor):
+        # Satu assignment: request lain melihat versi lama atau baru, tidak pernah setengah jadi
+        with self._lock:
+            self._current = predictor
+            self.version += 1
+            self.loaded_at = datetime.now().isoformat(timespec='seconds')
+            self.last_error = None
+            self._failed_signature = None
@@ -1,10 +1,15 @@
 import os
+import threading
+import time
+from collections import OrderedDict
 from datetime import datetime
 
 import joblib
 import numpy as np
 import pandas as pd  # Kita butuh pandas untuk holiday
 
+from .flat_forest import FlatForest
+
 # Coba impor holidays, jika gagal, beri peringatan
 try:
     from holidays import Indonesia
@@ -12,8 +17,62 @@ except ImportError:
     print("WARNING: 'holidays' library not installed. 'Is Holiday' feature will be 0.")
     Indonesia = None
 
+
+class PredictionCache:
+    """
+    Cache LRU + TTL untuk hasil prediksi, aman dipakai banyak thread.
+    Key-nya adalah vektor fitur yang sudah dinormalisasi, bukan body request mentah.
+    """
+    def __init__(self, maxsize=1024, ttl=300):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is not None and time.monotonic() - entry[0] < self.ttl:
+                self._data.move_to_end(key)
+                self.hits += 1
+                return entry[1]
+            if entry is not None:
+                del self._data[key] # Kadaluarsa
+            self.misses += 1
+            return None
+
+    def set(self, key, value):
+        with self._lock:
+            self._data[key] = (time.monotonic(), value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+
+    def info(self):
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_rate': round(self.hits / total * 100, 2) if total else 0,
+                'size': len(self._data),
+                'maxsize': self.maxsize,
+                'ttl': self.ttl,
+            }
+
+
 class SLAPredictor:
-    def __init__(self):
+    # Batch sampai ukuran ini dinilai dengan FlatForest; di atasnya traversal Cython
+    # sklearn lebih cepat (hasil keduanya bit-identik)
+    FLAT_FOREST_MAX_ROWS = 512
+
+    def __init__(self, cache_size=1024, cache_ttl=300, mmap_mode=None, inference='flat'):
         script_dir = os.path.dirname(os.path.abspath(__file__))
         model_path = os.path.join(script_dir, 'rf_sla_model.pkl')
         encoders_path = os.path.join(script_dir, 'label_encoders.pkl')
@@ -43,10 +102,21 @@ class SLAPredictor:
         if missing_files:
             raise FileNotFoundError(f"File hilang di {script_dir}: {', '.join(missing_files)}. Pastikan Anda sudah melatih ulang model dan menyalin file .pkl yang baru.")
         
-        self.model = joblib.load(model_path)
+        # Signature dibaca sebelum load: perubahan file selama load tetap terdeteksi (lihat ModelRegistry)
+        self.artifact_paths = [model_path, encoders_path, scaler_path, features_path]
+        self.artifact_signature = self.read_artifact_signature()
+
+        # mmap_mode='r': array numpy di dalam pickle (uncompressed) dibaca lewat mmap,
+        # halaman file dibagi antar proses worker lewat page cache
+        self.model = joblib.load(model_path, mmap_mode=mmap_mode)
+        if mmap_mode is not None:
+            self._detach_classes()
         self.encoders = joblib.load(encoders_path) # Dict encoders
         self.scaler = joblib.load(scaler_path)
         self.feature_names = joblib.load(features_path)
+
+        # Cache hasil prediksi per versi model (versi baru dari ModelRegistry = cache baru)
+        self.cache = PredictionCache(maxsize=cache_size, ttl=cache_ttl)
         
         # Cari tahu kolom mana yang di-scale saat training
         # Ini jauh lebih aman daripada hardcode indeks
@@ -58,108 +128,309 @@ class SLAPredictor:
             # Fallback jika versi scikit-learn lama (mengambil dari notebook Anda)
             self.scaled_feature_names = ['Days to Due'] # Sesuaikan jika Anda mengubah scaling di notebook
             print(f"Scaler fallback, asumsi fitur: {self.scaled_feature_names}")
+
+        self._build_feature_plan()
+        self._build_unique_values()
+
+        # Engine inferensi alternatif: array pohon rata + traversal per level (lihat flat_forest.py)
+        use_flat = inference == 'flat' and hasattr(self.model, 'estimators_')
+        self.flat_forest = FlatForest(self.model) if use_flat else None
+
+        # Indeks kolom probabilitas kelas 1 (Melanggar); self.model.classes_ berisi [0, 1]
+        self.violated_idx = int(np.where(self.model.classes_ == 1)[0][0])
             
         print("Model (versi baru) berhasil dimuat!")
         print(f"Model ini mengharapkan {len(self.feature_names)} fitur:")
         print(self.feature_names)
 
 
+    def _detach_classes(self):
+        """
+        Salin classes_ (forest & tiap pohon) dari np.memmap ke array biasa: label kelas
+        tidak ikut rusak jika file .pkl ditimpa di tempat selama proses berjalan.
+        """
+        for estimator in [self.model, *getattr(self.model, 'estimators_', [])]:
+            if isinstance(getattr(estimator, 'classes_', None), np.memmap):
+                estimator.classes_ = np.array(estimator.classes_)
+
+    def _build_feature_plan(self):
+        """
+        Precompile peta nama fitur -> indeks kolom, supaya preprocessing
+        bisa langsung menulis ke array float64 tanpa DataFrame.
+        """
+        self.feature_index = {name: idx for idx, name in enumerate(self.feature_names)}
+        self.n_features = len(self.feature_names)
+
+        # Kolom yang di-scale: (indeks di baris fitur, indeks kolom di scaler)
+        scaled = [
+            (self.feature_index[col], j)
+            for j, col in enumerate(self.scaled_feature_names) if col in self.feature_index
+        ]
+        self._scaled_idx = np.array([i for i, _ in scaled], dtype=np.intp)
+        self._scaled_cols = [self.scaled_feature_names[j] for _, j in scaled]
+
+        # MinMaxScaler cukup X * scale_ + min_ (operasi yang sama dengan scaler.transform)
+        if hasattr(self.scaler, 'scale_') and hasattr(self.scaler, 'min_') and not getattr(self.scaler, 'clip', False):
+            self._scale_mul = np.asarray(self.scaler.scale_, dtype=np.float64)[[j for _, j in scaled]]
+            self._scale_add = np.asarray(self.scaler.min_, dtype=np.float64)[[j for _, j in scaled]]
+            self._scale_direct = len(scaled) == len(self.scaled_feature_names)
+        else:
+            self._scale_direct = False
+
+        self._build_encoding_tables()
+
+    def _build_encoding_tables(self):
+        """
+        Bangun tabel lookup dict (nilai -> kode) dari label_encoders.pkl sekali saja,
+        termasuk kode fallback untuk nilai yang tidak dikenal ('nan' -> 'unknown' -> -1).
+        Kode = posisi di le.classes_, sama dengan hasil le.transform().
+        """
+        self._encoding_plan = []
+        for notebook_col, react_col in [
+            ('Priority', 'priority'), # (Nama di Notebook, Nama di Form React)
+            ('Category', 'category'),
+            ('Item', 'item'),
+            ('Sub Category', 'sub_category')
+        ]:
+            if notebook_col not in self.encoders or notebook_col not in self.feature_index:
+                continue
+            lookup = {str(cls): code for code, cls in enumerate(self.encoders[notebook_col].classes_)}
+            fallback = lookup.get('nan', lookup.get('unknown', -1))
+            self._encoding_plan.append(
+                (react_col, self.feature_index[notebook_col], lookup, fallback)
+            )
+
+    def _build_unique_values(self):
+        """
+        Opsi dropdown /api/unique-values/ dari encoders yang sudah di memori,
+        dibangun sekali saat model dimuat (ETag/304 diurus cached_response di view).
+        """
+        self.unique_values = None
+        self.unique_values_error = None
+        try:
+            categories = [
+                {'value': val, 'label': val.replace('-', ' ').title()}
+                for val in self.encoders['Category'].classes_ if val not in ['nan', 'unknown']
+            ]
+            items = [
+                {'value': val, 'label': val.title()}
+                for val in self.encoders['Item'].classes_ if val not in ['nan', 'unknown']
+            ]
+            sub_categories = [
+                {'value': val, 'label': val.title()}
+                for val in self.encoders['Sub Category'].classes_ if val not in ['nan', 'unknown']
+            ]
+        except KeyError as e:
+            self.unique_values_error = f'Key {e} tidak ditemukan di label_encoders.pkl.'
+            return
+
+        categories.sort(key=lambda x: x['label'])
+        items.sort(key=lambda x: x['label'])
+        sub_categories.sort(key=lambda x: x['label'])
+
+        self.unique_values = {'categories': categories, 'items': items, 'sub_categories': sub_categories}
+
+    def read_artifact_signature(self):
+        """ (mtime, ukuran) setiap file artefak; berubah jika ada .pkl yang ditimpa """
+        signature = []
+        for path in self.artifact_paths:
+            try:
+                st = os.stat(path)
+                signature.append((st.st_mtime_ns, st.st_size))
+            except OSError:
+                signature.append(None)
+        return tuple(signature)
+
+    def cache_info(self):
+        """ Statistik hit/miss cache prediksi (untuk menentukan ukuran cache) """
+        return self.cache.info()
+
     def _is_off(self, dt):
         """ Cek apakah tanggal adalah weekend (Sabtu=5, Minggu=6) atau hari libur """
         is_weekend = dt.weekday() >= 5
         is_holiday = dt.date() in self.holiday_dates
         return 1 if (is_weekend or is_holiday) else 0
 
-    def preprocess_input(self, input_data):
-        # 1. Konversi Tanggal
+    def _parse_dates(self, input_data):
+        """ open_date & due_date dari payload; harus sama-sama naive atau sama-sama ber-timezone """
         try:
             # Input dari form <input type="datetime-local"> adalah 'YYYY-MM-DDTHH:MM'
             open_dt = datetime.fromisoformat(input_data['open_date'])
             due_dt = datetime.fromisoformat(input_data['due_date'])
-        except ValueError as e:
+        except KeyError as e:
+            raise ValueError(f"Field {e} wajib ada.")
+        except (ValueError, TypeError) as e:
             raise ValueError(f"Format tanggal salah. Harusnya YYYY-MM-DDTHH:MM. Error: {e}")
+        if (open_dt.tzinfo is None) != (due_dt.tzinfo is None):
+            raise ValueError("open_date dan due_date harus sama-sama dengan atau tanpa timezone.")
+        return open_dt, due_dt
 
-        # 2. Buat DataFrame 1 baris untuk preprocessing
-        # Ini memastikan urutan dan nama kolom selalu benar
-        processed_df = pd.DataFrame(columns=self.feature_names)
+    # Urutan fitur turunan tanggal yang dihasilkan _date_features
+    DATE_FEATURES = (
+        'Days to Due', 'Open Month',
+        'Application Creation Day of Week', 'Application Creation Hour',
+        'Application SLA Deadline Day of Week', 'Application SLA Deadline Hour',
+        'Is Open Date Off', 'Is Due Date Off',
+    )
+
+    def _date_features(self, open_dt, due_dt):
+        """ Fitur turunan tanggal (sesuai notebook Cell 11-16), urutan DATE_FEATURES """
+        return (
+            (due_dt - open_dt).days,
+            open_dt.month,
+            open_dt.weekday() + 1, # Senin=1
+            open_dt.hour,
+            due_dt.weekday() + 1, # Senin=1
+            due_dt.hour,
+            self._is_off(open_dt),
+            self._is_off(due_dt),
+        )
+
+    def _categorical_value(self, input_data, react_col):
+        """ Nilai kategori dari form (lowercase/strip), fallback 'nan' jika field tidak ada """
+        value = input_data.get(react_col, 'nan')
+        if not isinstance(value, str):
+            raise ValueError(f"Field {react_col} harus berupa teks.")
+        return value.lower().strip()
+
+    def preprocess_input(self, input_data):
+        X, _ = self._preprocess_row(input_data)
+        return X
+
+    def _preprocess_row(self, input_data):
+        """ Seperti preprocess_input, tapi juga mengembalikan fitur turunan mentah (sebelum scaling) """
+        # 1. Konversi Tanggal
+        open_dt, due_dt = self._parse_dates(input_data)
+
+        # 2. Baris fitur float64 yang sudah dialokasikan (fitur yg tidak diisi tetap 0)
+        row = np.zeros((1, self.n_features), dtype=np.float64)
+        fi = self.feature_index
         
         # 3. Hitung Fitur Turunan (sesuai notebook Cell 11-16)
-        processed_df.loc[0, 'Days to Due'] = (due_dt - open_dt).days
-        processed_df.loc[0, 'Open Month'] = open_dt.month
-        processed_df.loc[0, 'Application Creation Day of Week'] = open_dt.weekday() + 1 # Senin=1
-        processed_df.loc[0, 'Application Creation Hour'] = open_dt.hour
-        processed_df.loc[0, 'Application SLA Deadline Day of Week'] = due_dt.weekday() + 1 # Senin=1
-        processed_df.loc[0, 'Application SLA Deadline Hour'] = due_dt.hour
-        processed_df.loc[0, 'Is Open Date Off'] = self._is_off(open_dt)
-        processed_df.loc[0, 'Is Due Date Off'] = self._is_off(due_dt)
+        features = self._date_features(open_dt, due_dt)
+        for name, value in zip(self.DATE_FEATURES, features):
+            if name in fi:
+                row[0, fi[name]] = value
+        days_to_due = features[0]
         
-        # 4. Handle Fitur Kategorikal (dari input form)
-        for col_name_map in [
-            ('Priority', 'priority'), # (Nama di Notebook, Nama di Form React)
-            ('Category', 'category'),
-            ('Item', 'item'),
-            ('Sub Category', 'sub_category') # Tambahkan 'sub_category' di React
-        ]:
-            notebook_col, react_col = col_name_map
-            
-            if notebook_col in self.encoders:
-                le = self.encoders[notebook_col]
-                input_val = input_data.get(react_col, 'nan').lower().strip() # Ambil dari form, fallback 'nan'
-
-                # Cek apakah nilai ini ada saat training
-                if input_val in le.classes_:
-                    encoded_val = le.transform([input_val])[0]
-                else:
-                    # Jika nilai baru (unseen), kita fallback
-                    # Coba 'nan' (jika Sub Category kosong) atau 'unknown'
-                    if 'nan' in le.classes_:
-                        encoded_val = le.transform(['nan'])[0]
-                    elif 'unknown' in le.classes_:
-                         encoded_val = le.transform(['unknown'])[0]
-                    else:
-                        encoded_val = -1 # Nilai aman jika 'nan' pun tidak ada
-                
-                processed_df.loc[0, notebook_col] = encoded_val
-            
-        # 5. Isi sisanya dengan 0 (jika ada fitur yg terlewat, misal Wc, Ac, dll.)
-        processed_df = processed_df.fillna(0)
+        # 4. Handle Fitur Kategorikal (dari input form), nilai unseen -> kode fallback
+        for react_col, idx, lookup, fallback in self._encoding_plan:
+            row[0, idx] = lookup.get(self._categorical_value(input_data, react_col), fallback)
         
-        # 6. Scaling (Cara Aman)
-        if self.scaled_feature_names:
-            # Pastikan kolom scaling ada di df
-            cols_to_scale = [col for col in self.scaled_feature_names if col in processed_df.columns]
-            if cols_to_scale:
-                processed_df[cols_to_scale] = self.scaler.transform(processed_df[cols_to_scale])
-        
-        # 7. Kembalikan sebagai numpy array
-        # Pastikan urutannya SAMA PERSIS dengan saat training
-        return processed_df[self.feature_names].values
+        # 5. Scaling (urutan kolom sudah SAMA PERSIS dengan saat training)
+        derived = {'days_to_due': days_to_due, 'open_hour': open_dt.hour}
+        return self._scale(row), derived
 
-    def predict(self, input_data):
+    def predict(self, input_data, use_cache=True):
         try:
-            X = self.preprocess_input(input_data)
-            
-            pred = self.model.predict(X)[0]
-            proba_all = self.model.predict_proba(X)[0]
-            
-            # Cari probabilitas untuk kelas 1 (Melanggar)
-            # self.model.classes_ akan berisi [0, 1]
-            violated_idx = np.where(self.model.classes_ == 1)[0][0]
-            prob = proba_all[violated_idx] * 100
+            X, derived = self._preprocess_row(input_data)
+
+            # Vektor fitur (kategori sudah di-lowercase/strip + fitur tanggal) sebagai key:
+            # banyak timestamp berbeda menghasilkan vektor yang sama
+            if use_cache:
+                cache_key = X.tobytes()
+                cached = self.cache.get(cache_key)
+                if cached is not None:
+                    return dict(cached)
             
-            # Ambil data turunan untuk ditampilkan
-            days_to_due = (datetime.fromisoformat(input_data['due_date']) - datetime.fromisoformat(input_data['open_date'])).days
-            open_hour = datetime.fromisoformat(input_data['open_date']).hour
+            # Satu kali telusur forest: label = kelas dengan probabilitas tertinggi
+            # (sama dengan cara RandomForestClassifier.predict menghitungnya)
+            proba_all = self._predict_proba(X)[0]
+            pred = self.model.classes_[np.argmax(proba_all)]
+            prob = proba_all[self.violated_idx] * 100
             
-            return {
+            result = {
                 'status': 'sukses',
                 'sla_violated': bool(pred),
                 'confidence': round(prob, 2),
                 'violation_text': 'Ya' if pred else 'Tidak',
-                'days_to_due': days_to_due,
-                'open_hour': open_hour
+                'days_to_due': derived['days_to_due'],
+                'open_hour': derived['open_hour']
             }
+            if use_cache:
+                self.cache.set(cache_key, result)
+            return dict(result)
         except Exception as e:
             print(f"ERROR saat prediksi: {e}")
             # Mengembalikan error ke frontend
-            return {'status': 'error', 'message': str(e)}
\ No newline at end of file
+            return {'status': 'error', 'message': str(e)}
+
+    def _predict_proba(self, X):
+        """ predict_proba lewat FlatForest untuk batch kecil (tanpa overhead per pohon sklearn) """
+        if self.flat_forest is not None and len(X) <= self.FLAT_FOREST_MAX_ROWS and not np.isnan(X).any():
+            return self.flat_forest.predict_proba(X)
+        return self.model.predict_proba(X)
+
+    def _scale(self, X):
+        """ Scaling kolom numerik pada matriks X (in-place) sesuai feature plan """
+        if not len(self._scaled_idx):
+            return X
+        if self._scale_direct:
+            X[:, self._scaled_idx] = X[:, self._scaled_idx] * self._scale_mul + self._scale_add
+        else:
+            X[:, self._scaled_idx] = self.scaler.transform(
+                pd.DataFrame(X[:, self._scaled_idx], columns=self._scaled_cols)
+            )
+        return X
+
+    def _build_batch(self, records):
+        """ Bangun matriks fitur (belum di-scale) + fitur turunan mentah untuk semua baris """
+        fi = self.feature_index
+        X = np.zeros((len(records), self.n_features), dtype=np.float64)
+
+        # 1. Konversi Tanggal & fitur turunan: aturan yang sama persis dengan preprocess_input
+        # (jam/tanggal lokal sesuai offset masing-masing, timezone campuran ditolak)
+        features = np.array(
+            [self._date_features(*self._parse_dates(r)) for r in records], dtype=np.int64,
+        ).reshape(len(records), len(self.DATE_FEATURES))
+        derived = dict(zip(self.DATE_FEATURES, features.T))
+        for name, values in derived.items():
+            if name in fi:
+                X[:, fi[name]] = values
+
+        # 2. Fitur Kategorikal: lookup kelas -> kode, fallback 'nan'/'unknown'
+        for react_col, idx, lookup, fallback in self._encoding_plan:
+            values = [r.get(react_col, 'nan') for r in records]
+            if not all(isinstance(value, str) for value in values):
+                raise ValueError(f"Field {react_col} harus berupa teks.")
+            X[:, idx] = [lookup.get(value.lower().strip(), fallback) for value in values]
+
+        return X, derived
+
+    def preprocess_batch(self, records):
+        """
+        Versi vektor dari preprocess_input: semua baris diproses sekaligus
+        menjadi satu matriks numpy (n_baris x n_fitur).
+        """
+        X, _ = self._build_batch(records)
+        return self._scale(X)
+
+    def predict_batch(self, records):
+        """
+        Prediksi banyak tiket dalam satu panggilan RandomForest.
+        Mengembalikan list hasil dengan format yang sama seperti predict().
+        """
+        if not records:
+            return []
+
+        X, derived = self._build_batch(records)
+        X = self._scale(X)
+        proba_all = self._predict_proba(X)
+
+        # Label diturunkan dari probabilitas, jadi forest cukup ditelusuri sekali
+        preds = self.model.classes_[np.argmax(proba_all, axis=1)]
+        probs = proba_all[:, self.violated_idx] * 100
+
+        return [
+            {
+                'status': 'sukses',
+                'sla_violated': bool(pred),
+                'confidence': round(float(prob), 2),
+                'violation_text': 'Ya' if pred else 'Tidak',
+                'days_to_due': int(days),
+                'open_hour': int(hour)
+            }
+            for pred, prob, days, hour in zip(
+                preds, probs, derived['Days to Due'], derived['Application Creation Hour']
+            )
+        ]
\ No newline at end of file
@@ -0,0 +1,30 @@
+import logging
+import time
+
+logger = logging.getLogger('tickets.queries')
+
+
+class QueryStats:
+    """
+    Execute wrapper (connection.execute_wrapper) yang mencatat jumlah dan durasi
+    query SQL selama satu request.
+    """
+    def __init__(self):
+        self.count = 0
+        self.duration = 0.0
+
+    def __call__(self, execute, sql, params, many, context):
+        start = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.count += 1
+            self.duration += time.perf_counter() - start
+
+    def annotate(self, request, response):
+        """ Tambahkan header X-Query-Count / X-Query-Time-Ms dan log ringkasannya """
+        duration_ms = self.duration * 1000
+        response['X-Query-Count'] = str(self.count)
+        response['X-Query-Time-Ms'] = f'{duration_ms:.2f}'
+        logger.debug('%s %s: %d query, %.2f ms', request.method, request.get_full_path(), self.count, duration_ms)
+        return response
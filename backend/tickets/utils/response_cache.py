@@ -0,0 +1,102 @@
+import functools
+import hashlib
+import json
+import time
+
+from django.conf import settings
+from django.core.cache import caches
+from django.core.serializers.json import DjangoJSONEncoder
+from django.utils.cache import get_conditional_response
+from rest_framework.response import Response
+
+# Nilai filter yang sama artinya dengan parameter tidak dikirim (lihat get_filtered_queryset)
+EMPTY_PARAM_VALUES = {'', 'all'}
+
+
+class ResponseCache:
+    """
+    Cache data response endpoint analitik di Django cache framework,
+    dengan key = generasi + endpoint + query parameter yang dinormalisasi.
+
+    invalidate() mengganti nomor generasi (dipanggil import_tickets, rebuild_ticket_stats
+    dan hot reload model), jadi semua entri lama otomatis tidak terpakai dan habis
+    sendiri lewat TIMEOUT/culling backend. Generasi disimpan di cache yang sama,
+    karena itu backend harus dibagi antar proses (file/redis/memcached) agar
+    invalidasi dari manage.py terlihat oleh semua worker.
+    """
+    def __init__(self, alias='default', prefix='analytics'):
+        self.alias = alias
+        self.prefix = prefix
+        self.generation_key = f'{prefix}:generation'
+
+    @property
+    def cache(self):
+        return caches[self.alias]
+
+    def generation(self):
+        # time_ns sebagai nilai awal: jika key generasi hilang (di-cull/cache dihapus),
+        # generasi baru tidak pernah sama dengan generasi entri lama
+        return self.cache.get_or_set(self.generation_key, time.time_ns, timeout=None)
+
+    def invalidate(self):
+        self.cache.set(self.generation_key, time.time_ns(), timeout=None)
+
+    def make_key(self, endpoint, params):
+        """ Key untuk endpoint + {param: [nilai]}; urutan parameter dan nilai kosong/'all' tidak berpengaruh """
+        normalized = sorted(
+            (name, sorted(set(values) - EMPTY_PARAM_VALUES))
+            for name, values in params.items()
+            if set(values) - EMPTY_PARAM_VALUES
+        )
+        digest = hashlib.md5(json.dumps([endpoint, normalized]).encode('utf-8')).hexdigest()
+        return f'{self.prefix}:{self.generation()}:{endpoint}:{digest}'
+
+    def get(self, key):
+        return self.cache.get(key)
+
+    def set(self, key, data):
+        """ Simpan data response beserta ETag-nya (hash isi, jadi tetap sama jika isinya tidak berubah) """
+        content = json.dumps(data, cls=DjangoJSONEncoder, sort_keys=True).encode('utf-8')
+        entry = {'data': data, 'etag': '"%s"' % hashlib.md5(content).hexdigest()}
+        self.cache.set(key, entry)
+        return entry
+
+
+analytics_cache = ResponseCache(alias=getattr(settings, 'ANALYTICS_CACHE_ALIAS', 'default'))
+
+
+def conditional_response(request, data, etag):
+    """ 304 jika If-None-Match klien cocok dengan etag, selain itu data dengan header ETag """
+    not_modified = get_conditional_response(request, etag=etag)
+    if not_modified is not None:
+        return not_modified
+
+    response = Response(data)
+    response['ETag'] = etag
+    response['Cache-Control'] = 'no-cache'  # Selalu revalidasi, jawabannya 304 jika tidak berubah
+    return response
+
+
+def cached_response(endpoint, params=(), response_cache=analytics_cache, version=None):
+    """
+    Decorator untuk function view DRF (pasang di bawah @api_view): data response 200
+    di-cache per `params` yang dipakai view, dan klien dengan If-None-Match mendapat 304.
+    version: callable opsional, nilainya ikut key (mis. mtime file sumber yang tidak
+    melewati invalidate()). Response dengan Cache-Control: no-store tidak di-cache.
+    """
+    def decorator(view):
+        @functools.wraps(view)
+        def wrapper(request, *args, **kwargs):
+            key_params = {name: request.query_params.getlist(name) for name in params}
+            if version is not None:
+                key_params['_version'] = [json.dumps(version())]
+            key = response_cache.make_key(endpoint, key_params)
+            entry = response_cache.get(key)
+            if entry is None:
+                response = view(request, *args, **kwargs)
+                if response.status_code != 200 or 'no-store' in response.get('Cache-Control', ''):
+                    return response  # Error tidak di-cache
+                entry = response_cache.set(key, response.data)
+            return conditional_response(request, entry['data'], entry['etag'])
+        return wrapper
+    return decorator
@@ -0,0 +1,31 @@
+# Kolom CSV tiket, dipakai import_tickets dan export /api/tickets/export/
+
+DATE_FORMAT = '%Y-%m-%d %H:%M:%S'
+
+# Mapping kolom CSV -> field Ticket (sesuai model terbaru dari panduan sebelumnya)
+# Jenis: str, datetime, datetime_null (boleh kosong), float, int, bool (0/1)
+COLUMN_MAP = [
+    ('Number', 'number', 'str'),
+    ('Priority', 'priority', 'str'),
+    ('Category', 'category', 'str'),
+    ('Open Date', 'open_date', 'datetime'),
+    ('Closed Date', 'closed_date', 'datetime_null'),
+    ('Due Date', 'due_date', 'datetime'),
+    ('Time Left Incl. On Hold', 'time_left_incl_on_hold', 'float'),
+    ('Item', 'item', 'str'),
+    ('Is SLA Violated', 'is_sla_violated', 'bool'),
+    ('Is Open Date Off', 'is_open_date_off', 'str'),
+    ('Is Due Date Off', 'is_due_date_off', 'str'),
+    ('Days to Due', 'days_to_due', 'int'),
+    ('Open Month', 'open_month', 'int'),
+    ('Application Creation Day of Week', 'application_creation_day_of_week', 'str'),
+    ('Application Creation Hour', 'application_creation_hour', 'int'),
+    ('Application SLA Deadline Day of Week', 'application_sla_deadline_day_of_week', 'str'),
+    ('Application SLA Deadline Hour', 'application_sla_deadline_hour', 'int'),
+    ('Resolution Duration', 'resolution_duration', 'float'),
+    ('Total Tickets Resolved (Wc)', 'total_tickets_resolved_wc', 'float'),
+    ('SLA Threshold', 'sla_threshold', 'float'),
+    ('Average Resolution Time (Ac)', 'average_resolution_time_ac', 'float'),
+    ('SLA to Average Resolution Ratio (Rc)', 'sla_to_average_resolution_ratio_rc', 'float'),
+    ('Application SLA Compliance Rate', 'application_sla_compliance_rate', 'float'),
+]
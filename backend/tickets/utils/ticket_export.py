@@ -0,0 +1,117 @@
+import csv
+import io
+
+from django.utils import timezone
+
+from .ticket_columns import COLUMN_MAP, DATE_FORMAT
+
+FIELDS = [field for _, field, _ in COLUMN_MAP]
+
+
+def iter_ticket_rows(queryset, chunk_size):
+    """
+    Tuple nilai field COLUMN_MAP per tiket. values_list + iterator(): tanpa objek model
+    dan tanpa cache queryset; di PostgreSQL diambil lewat server-side cursor per chunk_size baris.
+    """
+    return queryset.values_list(*FIELDS).iterator(chunk_size=chunk_size)
+
+
+def _csv_formatter(kind, tz):
+    """ Format nilai sama dengan CSV sumber import_tickets, jadi hasil export bisa di-import ulang """
+    if kind in ('datetime', 'datetime_null'):
+        return lambda value: '' if value is None else timezone.localtime(value, tz).strftime(DATE_FORMAT)
+    if kind == 'bool':
+        return int
+    return None
+
+
+def stream_csv(queryset, chunk_size=5000):
+    """ CSV (header = kolom COLUMN_MAP) sebagai potongan bytes, satu potong per chunk_size baris """
+    tz = timezone.get_default_timezone()
+    formatters = [(i, _csv_formatter(kind, tz)) for i, (_, _, kind) in enumerate(COLUMN_MAP)]
+    formatters = [(i, fmt) for i, fmt in formatters if fmt is not None]
+
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow([csv_col for csv_col, _, _ in COLUMN_MAP])
+
+    for count, row in enumerate(iter_ticket_rows(queryset, chunk_size), 1):
+        row = list(row)
+        for i, fmt in formatters:
+            row[i] = fmt(row[i])
+        writer.writerow(row)
+        if count % chunk_size == 0:
+            yield buffer.getvalue().encode('utf-8')
+            buffer.seek(0)
+            buffer.truncate()
+    yield buffer.getvalue().encode('utf-8')
+
+
+class _ChunkSink(io.RawIOBase):
+    """ File tujuan ParquetWriter yang menampung bytes sampai diambil dengan drain() """
+    def __init__(self):
+        self.chunks = []
+        self.position = 0
+
+    def writable(self):
+        return True
+
+    def write(self, data):
+        self.chunks.append(bytes(data))
+        self.position += len(data)
+        return len(data)
+
+    def tell(self):
+        return self.position
+
+    def drain(self):
+        data = b''.join(self.chunks)
+        self.chunks.clear()
+        return data
+
+
+def parquet_schema():
+    import pyarrow as pa
+
+    types = {
+        'str': pa.string(),
+        'datetime': pa.timestamp('us', tz='UTC'),
+        'datetime_null': pa.timestamp('us', tz='UTC'),
+        'float': pa.float64(),
+        'int': pa.int64(),
+        'bool': pa.bool_(),
+    }
+    return pa.schema([(field, types[kind]) for _, field, kind in COLUMN_MAP])
+
+
+def stream_parquet(queryset, chunk_size=5000):
+    """
+    Parquet (kolom = nama field Ticket, bertipe) sebagai potongan bytes:
+    satu row group per chunk_size baris, langsung dikirim setelah ditulis.
+    Butuh pyarrow.
+    """
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    schema = parquet_schema()
+    sink = _ChunkSink()
+    writer = pq.ParquetWriter(sink, schema, compression='snappy')
+
+    def write_rows(rows):
+        columns = list(zip(*rows))
+        writer.write_table(pa.Table.from_arrays(
+            [pa.array(values, type=column.type) for values, column in zip(columns, schema)],
+            schema=schema,
+        ))
+
+    rows = []
+    for row in iter_ticket_rows(queryset, chunk_size):
+        rows.append(row)
+        if len(rows) == chunk_size:
+            write_rows(rows)
+            rows = []
+            yield sink.drain()
+    if rows:
+        write_rows(rows)
+    writer.close()  # Footer (metadata row group) ditulis saat close
+    yield sink.drain()
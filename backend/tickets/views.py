@@ -1,40 +1,67 @@
 import json
 import os
+from concurrent.futures import ThreadPoolExecutor
 from datetime import timedelta
 
-import joblib
-import numpy as np
 from django.conf import settings
 from django.contrib.auth import get_user_model
 from django.core.mail import send_mail
-from django.db.models import Avg, Count, FloatField, Q
-from django.db.models.functions import Cast, TruncMonth
-from django.http import JsonResponse
+from django.db import close_old_connections, connection
+from django.db.models import Avg, Count, FloatField, Q, Sum
+from django.db.models.functions import Cast, Coalesce, NullIf, TruncMonth
+from django.http import JsonResponse, StreamingHttpResponse
 from django.utils import timezone
 from django.utils.crypto import get_random_string
 from rest_framework import status, viewsets
-from rest_framework.decorators import api_view
+from rest_framework.decorators import action, api_view
 from rest_framework.pagination import PageNumberPagination
 from rest_framework.response import Response
 
-from .models import Ticket, UserProfile
-from .serializers import TicketSerializer
-from .utils.model_utils import SLAPredictor
+from .models import Ticket, TicketDailyStat, UserProfile
+from .pagination import CachedCountPaginator, TicketCursorPagination
+from .renderers import CSVExportRenderer, ParquetExportRenderer
+from .serializers import TICKET_LIST_FIELDS, TicketSerializer, serialize_ticket_rows
+from .utils.cluster_store import ClusterStore
+from .utils.log_writer import PredictionLogWriter
+from .utils.model_registry import ModelRegistry
+from .utils.query_stats import QueryStats
+from .utils.response_cache import analytics_cache, cached_response
+from .utils.ticket_export import stream_csv, stream_parquet
 
 AuthUser = get_user_model()
-predictor = SLAPredictor()
+model_registry = ModelRegistry(  # Hot reload jika file .pkl diganti
+    on_reload=analytics_cache.invalidate,  # feature importance ikut berubah dengan model
+    cache_size=getattr(settings, 'PREDICTION_CACHE_SIZE', 1024),
+    cache_ttl=getattr(settings, 'PREDICTION_CACHE_TTL', 300),
+    mmap_mode=getattr(settings, 'PREDICTOR_MMAP_MODE', None),
+    inference=getattr(settings, 'PREDICTOR_INFERENCE', 'flat'),
+)
+prediction_log_writer = PredictionLogWriter(
+    batch_size=getattr(settings, 'PREDICTION_LOG_BATCH_SIZE', 500),
+    flush_interval=getattr(settings, 'PREDICTION_LOG_FLUSH_INTERVAL', 1.0),
+    max_queue=getattr(settings, 'PREDICTION_LOG_QUEUE_SIZE', 10000),
+)
 APP_DIR = os.path.dirname(os.path.abspath(__file__))
-ENCODERS_PATH = os.path.join(APP_DIR, 'utils', 'label_encoders.pkl')
 FEATURE_IMPORTANCE_PATH = os.path.join(APP_DIR, 'utils', 'feature_importances.json')
+MAX_BATCH_SIZE = 10000  # Batas baris per request /api/predict/batch/
+CLUSTER_RESULTS_PATH = os.path.join(settings.BASE_DIR, 'tickets', 'static', 'clustering', 'cluster_results.json')
+cluster_store = ClusterStore(CLUSTER_RESULTS_PATH)
+MAX_CLUSTER_POINTS = 20000  # Batas ?points= untuk /api/clusters/
+# Thread untuk query DB /api/dashboard/summary/ yang dijalankan paralel
+dashboard_executor = ThreadPoolExecutor(
+    max_workers=getattr(settings, 'DASHBOARD_SUMMARY_WORKERS', 3),
+    thread_name_prefix='dashboard-summary',
+)
 
 
 # --- Fungsi Helper untuk Queryset ---
-def get_filtered_queryset(request):
+def get_filtered_queryset(request, queryset=None):
     """
     Fungsi helper terpusat untuk menerapkan filter umum
-    dari query parameter ke Ticket queryset.
+    dari query parameter ke Ticket queryset (atau queryset lain dengan field yang sama).
     """
-    queryset = Ticket.objects.all()
+    if queryset is None:
+        queryset = Ticket.objects.all()
     
     # Filter Prioritas
     priority_filter = request.query_params.get('priority', None)
@@ -50,6 +77,183 @@ def get_filtered_queryset(request):
             queryset = queryset.filter(is_sla_violated=False)
             
     return queryset
+
+
+# Query parameter filter yang dipakai get_filtered_queryset (juga key cache response analitik)
+FILTER_PARAMS = ('priority', 'is_sla_violated')
+# Filter yang bisa dijawab dari rollup TicketDailyStat (kolom kuncinya)
+ROLLUP_FILTER_PARAMS = {'priority', 'is_sla_violated'}
+ROLLUP_SUM_FIELDS = {
+    'resolution_duration': 'resolution_duration_sum',
+    'application_sla_compliance_rate': 'compliance_rate_sum',
+}
+
+
+def get_stats_queryset(request):
+    """
+    Sumber data endpoint statistik: (queryset, rollup).
+    Rollup harian TicketDailyStat dipakai jika semua filter yang diterapkan
+    get_filtered_queryset didukung rollup, selain itu fallback ke tabel Ticket.
+    Parameter lain (sections, format, ...) tidak mengubah data, jadi tidak ikut menentukan.
+    """
+    use_rollup = getattr(settings, 'TICKET_STATS_USE_ROLLUP', True)
+    applied = {name for name in FILTER_PARAMS if request.query_params.get(name) not in (None, '', 'all')}
+    if use_rollup and applied <= ROLLUP_FILTER_PARAMS:
+        return get_filtered_queryset(request, TicketDailyStat.objects.all()), True
+    return get_filtered_queryset(request), False
+
+
+def ticket_count(rollup, **filters):
+    """ Jumlah tiket (opsional dengan filter) sebagai ekspresi agregat untuk sumber data yang dipilih """
+    condition = Q(**filters) if filters else None
+    if rollup:
+        return Coalesce(Sum('ticket_count', filter=condition), 0)
+    return Count('number', filter=condition)
+
+
+def ticket_average(rollup, field):
+    """ Rata-rata field Ticket; di rollup = jumlah / jumlah tiket """
+    if rollup:
+        return Sum(ROLLUP_SUM_FIELDS[field]) / Cast(NullIf(Sum('ticket_count'), 0), FloatField())
+    return Avg(field)
+
+
+# --- Perhitungan statistik (dipakai endpoint /api/stats/... dan /api/dashboard/summary/) ---
+def compute_stats(queryset, rollup):
+    """ Ringkasan KPI tiket untuk kartu Dashboard """
+    # Semua agregat dihitung dalam satu query (rollup harian, atau satu kali scan tabel Ticket)
+    agg = queryset.aggregate(
+        total=ticket_count(rollup),
+        violations=ticket_count(rollup, is_sla_violated=True),
+        low_priority=ticket_count(rollup, priority='4 - Low'),
+        medium_priority=ticket_count(rollup, priority='3 - Medium'),
+        high_priority=ticket_count(rollup, priority='2 - High'),
+        critical_priority=ticket_count(rollup, priority='1 - Critical'),
+        avg_duration=ticket_average(rollup, 'resolution_duration'),
+        avg_compliance=ticket_average(rollup, 'application_sla_compliance_rate'),
+    )
+
+    total = agg['total']
+    violations = agg['violations']
+    compliance = total - violations
+    rate = (compliance / total * 100) if total > 0 else 0
+
+    low_priority = agg['low_priority']
+    medium_priority = agg['medium_priority']
+    high_priority = agg['high_priority']
+    critical_priority = agg['critical_priority']
+    avg_duration = agg['avg_duration'] or 0
+    avg_compliance = agg['avg_compliance'] or 0
+
+    data = {
+        'total_tickets': total,
+        'violation_count': violations,
+        'compliance_count': compliance,
+        'compliance_rate': round(rate, 1),
+        'low_priority_count': low_priority,
+        'medium_priority_count': medium_priority,
+        'high_priority_count': high_priority,
+        'critical_priority_count': critical_priority,
+        'avg_resolution_duration': round(avg_duration, 2),
+        'avg_compliance_rate': round(avg_compliance * 100, 1),
+    }
+    return data
+
+
+def compute_violation_by_category(queryset, rollup):
+    """ Persentase pelanggaran SLA untuk 10 kategori dengan tiket terbanyak """
+    category_stats = queryset.values('category').annotate(
+        total_tickets=ticket_count(rollup),
+        violated_tickets=ticket_count(rollup, is_sla_violated=True)
+    ).order_by('-total_tickets', 'category')  # category: urutan seri tetap sama antara rollup & tabel Ticket
+
+    results = []
+    for stat in category_stats[:10]:
+        total = stat['total_tickets']
+        violated = stat['violated_tickets']
+        violation_rate = (violated / total * 100) if total > 0 else 0
+        results.append({
+            'category': stat['category'],
+            'violation_rate': round(violation_rate, 2),
+            'total_tickets': total 
+        })
+    return results
+
+
+def compute_monthly_trend(queryset, rollup):
+    """ Total tiket dan tiket melanggar per bulan """
+    monthly_data = queryset.annotate(
+        month=TruncMonth('day' if rollup else 'open_date')
+    ).values('month').annotate(
+        total_tickets=ticket_count(rollup),
+        violated_tickets=ticket_count(rollup, is_sla_violated=True)
+    ).order_by('month') 
+
+    return [
+        {
+            'month': data['month'].strftime('%Y-%m'), 
+            'total_tickets': data['total_tickets'],
+            'violated_tickets': data['violated_tickets']
+        } for data in monthly_data
+    ]
+
+
+def load_feature_importance():
+    """ 10 fitur teratas dari feature_importances.json (disimpan dari notebook) """
+    with open(FEATURE_IMPORTANCE_PATH, 'r') as f:
+        return json.load(f)[:10]
+
+
+def run_db_task(func, *args):
+    """
+    Jalankan func di thread dashboard_executor. Thread pool tidak melewati
+    request_started/request_finished, jadi close_old_connections() dipanggil sendiri
+    sebelum dan sesudah task: koneksi yang error atau melewati CONN_MAX_AGE ditutup.
+    """
+    close_old_connections()
+    try:
+        return func(*args)
+    finally:
+        close_old_connections()
+
+
+def compute_unique_values():
+    """ Opsi dropdown dari predictor aktif (sama dengan /api/unique-values/) """
+    predictor = model_registry.get()
+    if predictor.unique_values is None:
+        raise RuntimeError(predictor.unique_values_error)
+    return predictor.unique_values
+
+
+def feature_importance_mtime():
+    """ Versi feature_importances.json untuk key cache (None jika file tidak ada) """
+    try:
+        return os.stat(FEATURE_IMPORTANCE_PATH).st_mtime_ns
+    except OSError:
+        return None
+
+
+def summary_file_signature():
+    """
+    Versi file sumber bagian clusters & feature_importance untuk key cache summary:
+    file ini bisa diganti tanpa lewat analytics_cache.invalidate (lihat ClusterStore).
+    """
+    return [cluster_store.signature(), feature_importance_mtime()]
+
+
+# Bagian /api/dashboard/summary/: yang butuh query DB (paralel) dan yang tidak
+SUMMARY_DB_SECTIONS = {
+    'stats': compute_stats,
+    'violation_by_category': compute_violation_by_category,
+    'monthly_trend': compute_monthly_trend,
+}
+SUMMARY_LOCAL_SECTIONS = {
+    'feature_importance': load_feature_importance,
+    'clusters': cluster_store.get_charts,
+    'unique_values': compute_unique_values,
+}
+SUMMARY_SECTIONS = (*SUMMARY_DB_SECTIONS, *SUMMARY_LOCAL_SECTIONS)
+
 # --- Akhir Fungsi Helper ---
 
 
@@ -104,14 +308,13 @@ def verify_otp(request):
         return Response({'error': 'Email tidak terdaftar'}, status=400)
 
 @api_view(['GET'])
+@cached_response('feature-importance', version=feature_importance_mtime)
 def get_feature_importance(request):
     """
     Membaca data feature importance yang disimpan dari notebook.
     """
     try:
-        with open(FEATURE_IMPORTANCE_PATH, 'r') as f:
-            importance_data = json.load(f)
-            return Response(importance_data[:10])
+        return Response(load_feature_importance())
     except FileNotFoundError:
         return Response({'error': f'File {os.path.basename(FEATURE_IMPORTANCE_PATH)} tidak ditemukan.'}, status=500)
     except Exception as e:
@@ -121,160 +324,47 @@ def get_feature_importance(request):
 def get_clusters(request):
     """
     API untuk data clustering K-Prototypes.
-    INI ADALAH VERSI YANG DIPERBAIKI.
+    Payload dibangun sekali per parameter dan di-cache sampai cluster_results.json berubah.
+    Query: ?points=N (jumlah titik scatter, sampel bertingkat per cluster),
+    ?mode=hist&bins=B (histogram 2D per cluster, ukuran payload tetap).
     """
-    json_path = os.path.join(settings.BASE_DIR, 'tickets', 'static', 'clustering', 'cluster_results.json')
-
-    # Fallback sample data (jika file tidak ada)
-    sample_data = {
-        'num_clusters': 0,
-        'summary_per_cluster': {},
-        'pca_coords': [],
-        'cluster_labels': [],
-        'numerical_columns_summary': [],
-        'categorical_columns_summary': [],
-    }
-
-    # Load data
+    mode = request.query_params.get('mode', 'scatter')
+    if mode not in ('scatter', 'hist'):
+        return Response({'error': "mode harus 'scatter' atau 'hist'"}, status=400)
     try:
-        if os.path.exists(json_path):
-            with open(json_path, 'r') as f:
-                data = json.load(f)
-            print("Cluster JSON loaded from file.")
-        else:
-            data = sample_data
-            print("Using sample data (cluster_results.json not found).")
-    except Exception as e:
-        print(f"Load error: {e}")
-        data = sample_data
-
-    # --- Mulai Membangun 'charts' ---
-    charts = {}
-    num_clusters = data.get('num_clusters', 0)
-    pca_coords = data.get('pca_coords', [])
-    cluster_labels = data.get('cluster_labels', [])
-    summary = data.get('summary_per_cluster', {})
-    numerical_cols = data.get('numerical_columns_summary', [])
-
-    # 1. PCA Scatter Chart Data
-    if pca_coords and cluster_labels and len(pca_coords) == len(cluster_labels) and num_clusters > 0:
-        pca_datasets = []
-        limit = 1000
-        indices_to_plot = np.random.choice(len(pca_coords), min(limit, len(pca_coords)), replace=False)
-
-        for cluster_id in range(num_clusters):
-            cluster_points = [
-                {'x': pca_coords[i][0], 'y': pca_coords[i][1]}
-                for i in indices_to_plot if cluster_labels[i] == cluster_id
-            ]
-            pca_datasets.append({
-                'label': f'Cluster {cluster_id}',
-                'data': cluster_points,
-                'backgroundColor': f'hsl({cluster_id * (360 / num_clusters)}, 70%, 50%)',
-                'pointRadius': 3,
-            })
-        charts['pca_scatter'] = {'datasets': pca_datasets}
-    else:
-        charts['pca_scatter'] = None
-
-    # 2. Mean Bar Chart Data
-    bar_chart_datasets = []
-    if summary and numerical_cols and num_clusters > 0:
-        for num_col in numerical_cols:
-            dataset = {
-                'label': num_col,
-                'data': [summary.get(str(i), {}).get('mean_numerical', {}).get(num_col, None) for i in range(num_clusters)],
-                'backgroundColor': f'hsl({np.random.randint(0, 360)}, 60%, 60%)',
-            }
-            bar_chart_datasets.append(dataset)
-    
-    charts['mean_bar'] = {
-        'labels': [f'Cluster {i}' for i in range(num_clusters)],
-        'datasets': bar_chart_datasets,
-    }
+        points = int(request.query_params.get('points', cluster_store.sample_limit))
+        bins = int(request.query_params.get('bins', 64))
+    except ValueError:
+        return Response({'error': 'points dan bins harus berupa angka'}, status=400)
+    if not 1 <= points <= MAX_CLUSTER_POINTS:
+        return Response({'error': f'points harus antara 1 dan {MAX_CLUSTER_POINTS}'}, status=400)
+    if not 1 <= bins <= cluster_store.max_bins:
+        return Response({'error': f'bins harus antara 1 dan {cluster_store.max_bins}'}, status=400)
+
+    return Response(cluster_store.get_charts(points=points, mode=mode, bins=bins))
 
-    # 3. Cluster Size Pie Chart Data
-    pie_charts_data = {}
-    if summary and num_clusters > 0:
-         pie_labels = []
-         cluster_sizes = []
-
-         for i in range(num_clusters):
-              cluster_summary = summary.get(str(i), {})
-              # Ambil mode 'Priority' untuk label
-              mode_value = cluster_summary.get('mode_categorical', {}).get('Priority', 'Unknown')
-              pie_labels.append(f"Cluster {i} ({mode_value})")
-              cluster_sizes.append(cluster_summary.get('size', 0))
-
-         background_colors = [f'hsl({i * (360 / num_clusters)}, 70%, 50%)' for i in range(num_clusters)]
-
-         pie_charts_data = {
-             'labels': pie_labels,
-             'datasets': [{
-                 'data': cluster_sizes,
-                 'backgroundColor': background_colors,
-             }],
-         }
-
-    charts['cluster_size_pie'] = pie_charts_data
-
-    # Kembalikan 'charts' yang sudah terisi penuh
-    return Response(charts)
-    
 
 @api_view(['GET'])
+@cached_response('violation-by-category', params=FILTER_PARAMS)
 def get_violation_by_category(request):
     """
     Menghitung persentase pelanggaran SLA per kategori.
     """
-    queryset = get_filtered_queryset(request)
-
-    category_stats = queryset.values('category').annotate(
-        total_tickets=Count('number'),
-        violated_tickets=Count('number', filter=Q(is_sla_violated=True))
-    ).order_by('-total_tickets') 
-
-    results = []
-    for stat in category_stats:
-        total = stat['total_tickets']
-        violated = stat['violated_tickets']
-        violation_rate = (violated / total * 100) if total > 0 else 0
-        results.append({
-            'category': stat['category'],
-            'violation_rate': round(violation_rate, 2),
-            'total_tickets': total 
-        })
-
-    return Response(results[:10])
+    return Response(compute_violation_by_category(*get_stats_queryset(request)))
 
 @api_view(['GET'])
+@cached_response('monthly-trend', params=FILTER_PARAMS)
 def get_monthly_trend(request):
     """
     Menghitung total tiket dan tiket melanggar per bulan.
     """
-    queryset = get_filtered_queryset(request)
-
-    monthly_data = queryset.annotate(
-        month=TruncMonth('open_date')
-    ).values('month').annotate(
-        total_tickets=Count('number'),
-        violated_tickets=Count('number', filter=Q(is_sla_violated=True))
-    ).order_by('month') 
-
-    results = [
-        {
-            'month': data['month'].strftime('%Y-%m'), 
-            'total_tickets': data['total_tickets'],
-            'violated_tickets': data['violated_tickets']
-        } for data in monthly_data
-    ]
-    return Response(results)
+    return Response(compute_monthly_trend(*get_stats_queryset(request)))
 
 @api_view(['POST'])
 def predict_sla(request):
     input_data = request.data
     try:
-        result = predictor.predict(input_data)
+        result = model_registry.get().predict(input_data)
         if result.get('status') == 'error':
              return Response({'error': result.get('message', 'Prediksi gagal')}, status=400)
 
@@ -282,57 +372,82 @@ def predict_sla(request):
         user = request.user if request.user.is_authenticated else None
         ip_address = request.META.get('REMOTE_ADDR')
 
-        PredictionLog.objects.create(
-            user=user, 
-            input_data=input_data, 
-            prediction_result=result, 
-            ip_address=ip_address
-        )
+        if getattr(settings, 'PREDICTION_LOG_ASYNC', True):
+            # Ditulis belakangan secara batch, tidak menahan response
+            prediction_log_writer.log(
+                user_id=user.pk if user else None,
+                input_data=input_data,
+                prediction_result=result,
+                ip_address=ip_address
+            )
+        else:
+            PredictionLog.objects.create(
+                user=user, 
+                input_data=input_data, 
+                prediction_result=result, 
+                ip_address=ip_address
+            )
         return Response(result)
     except Exception as e:
         print(f"Predict error detail: {type(e).__name__}: {e}")
         return Response({'error': f'Internal Server Error: {str(e)}'}, status=500)
+
+
+
+@api_view(['POST'])
+def predict_sla_batch(request):
+    """
+    Prediksi banyak tiket sekaligus (mis. seluruh backlog tiket open).
+    Body: list payload seperti /api/predict/, atau {"tickets": [...]}.
+    """
+    records = request.data.get('tickets') if isinstance(request.data, dict) else request.data
+    if not isinstance(records, list) or not all(isinstance(r, dict) for r in records):
+        return Response({'error': 'Body harus berupa list tiket atau {"tickets": [...]}'}, status=400)
+    if len(records) > MAX_BATCH_SIZE:
+        return Response({'error': f'Maksimal {MAX_BATCH_SIZE} tiket per request'}, status=400)
+
+    try:
+        results = model_registry.get().predict_batch(records)
+    except ValueError as e:
+        return Response({'error': str(e)}, status=400)
+    except Exception as e:
+        print(f"Batch predict error detail: {type(e).__name__}: {e}")
+        return Response({'error': f'Internal Server Error: {str(e)}'}, status=500)
+
+    return Response({'count': len(results), 'results': results})
+
+
+@api_view(['GET'])
+def get_prediction_cache_stats(request):
+    """
+    Statistik hit/miss cache prediksi (untuk menentukan PREDICTION_CACHE_SIZE),
+    status antrian PredictionLog dan versi model yang aktif.
+    """
+    return Response({
+        **model_registry.get().cache_info(),
+        'log_writer': prediction_log_writer.stats(),
+        'model': model_registry.info(),
+    })
     
     
 @api_view(['GET'])
+@cached_response('unique-values')
 def get_unique_values(request):
-    try:
-        encoders = joblib.load(ENCODERS_PATH)
-        
-        categories = [
-            {'value': val, 'label': val.replace('-', ' ').title()} 
-            for val in encoders['Category'].classes_ if val not in ['nan', 'unknown']
-        ]
-        items = [
-            {'value': val, 'label': val.title()} 
-            for val in encoders['Item'].classes_ if val not in ['nan', 'unknown']
-        ]
-        sub_categories = [
-            {'value': val, 'label': val.title()} 
-            for val in encoders['Sub Category'].classes_ if val not in ['nan', 'unknown']
-        ]
-        
-        categories.sort(key=lambda x: x['label'])
-        items.sort(key=lambda x: x['label'])
-        sub_categories.sort(key=lambda x: x['label'])
-
-        return Response({
-            'categories': categories,
-            'items': items,
-            'sub_categories': sub_categories
-        })
-    except FileNotFoundError:
-        return Response({'error': f'File encoders.pkl tidak ditemukan di {ENCODERS_PATH}'}, status=500)
-    except KeyError as e:
-        return Response({'error': f'Key {e} tidak ditemukan di label_encoders.pkl.'}, status=500)
-    except Exception as e:
-        return Response({'error': str(e)}, status=500)
+    """
+    Opsi kategori/item/sub kategori untuk form dan filter.
+    Daftar opsi sudah dibangun sekali saat predictor dimuat; cache di-invalidate saat model di-reload.
+    """
+    predictor = model_registry.get()
+    if predictor.unique_values is None:
+        return Response({'error': predictor.unique_values_error}, status=500)
+    return Response(predictor.unique_values)
 
 
 class TicketPagination(PageNumberPagination):
     page_size = 7 
     page_size_query_param = 'page_size'
     max_page_size = 100
+    django_paginator_class = CachedCountPaginator  # COUNT di-cache per kombinasi filter
 
 class TicketViewSet(viewsets.ReadOnlyModelViewSet):
     queryset = Ticket.objects.all().order_by('-open_date')
@@ -340,6 +455,23 @@ class TicketViewSet(viewsets.ReadOnlyModelViewSet):
     pagination_class = TicketPagination 
     lookup_field = 'number'
 
+    def dispatch(self, request, *args, **kwargs):
+        # Instrumentasi: jumlah & durasi query per request (header X-Query-Count/X-Query-Time-Ms)
+        stats = QueryStats()
+        with connection.execute_wrapper(stats):
+            response = super().dispatch(request, *args, **kwargs)
+        return stats.annotate(request, response)
+
+    @property
+    def paginator(self):
+        # Opt-in keyset pagination: ?cursor= (kosong untuk halaman pertama)
+        if not hasattr(self, '_paginator'):
+            if TicketCursorPagination.cursor_query_param in self.request.query_params:
+                self._paginator = TicketCursorPagination()
+            else:
+                self._paginator = self.pagination_class()
+        return self._paginator
+
     def get_queryset(self):
         base_queryset = super().get_queryset()
         queryset = base_queryset 
@@ -374,36 +506,89 @@ class TicketViewSet(viewsets.ReadOnlyModelViewSet):
         else:
             queryset = queryset.order_by('-open_date') 
 
-        print(f"Queryset count after filters: {queryset.count()}") 
         return queryset
 
+    def list(self, request, *args, **kwargs):
+        """
+        Listing ringan untuk tabel Dashboard: values() kolom TICKET_LIST_FIELDS diformat dalam
+        satu pass, bukan TicketSerializer per baris (yang tetap dipakai untuk detail).
+        """
+        queryset = self.filter_queryset(self.get_queryset()).values(*TICKET_LIST_FIELDS)
+        page = self.paginate_queryset(queryset)
+        if page is not None:
+            return self.get_paginated_response(serialize_ticket_rows(page))
+        return Response(serialize_ticket_rows(list(queryset)))
+
+    @action(detail=False, methods=['get'], renderer_classes=[CSVExportRenderer, ParquetExportRenderer])
+    def export(self, request):
+        """
+        /api/tickets/export/?format=csv|parquet: semua tiket dengan filter yang sama dengan listing
+        (search, priority, category, is_sla_violated, sort), di-stream per chunk sehingga
+        memori tetap konstan berapa pun jumlah barisnya. CSV memakai kolom CSV import_tickets
+        (bisa di-import ulang); Parquet memakai nama field dan tipe kolom asli.
+        """
+        export_format = request.accepted_renderer.format
+        chunk_size = getattr(settings, 'TICKET_EXPORT_CHUNK_SIZE', 5000)
+        queryset = self.get_queryset()
+        # Urutan deterministik seperti TicketCursorPagination: (open_date, number), arah mengikuti 'sort'
+        prefix = '-' if str(queryset.query.order_by[0]).startswith('-') else ''
+        queryset = queryset.order_by(f'{prefix}open_date', f'{prefix}number')
+
+        if export_format == 'parquet':
+            try:
+                import pyarrow  # noqa: F401
+            except ImportError:
+                return JsonResponse({'error': 'Export Parquet butuh pyarrow (pip install pyarrow).'}, status=501)
+            content = stream_parquet(queryset, chunk_size=chunk_size)
+        else:
+            content = stream_csv(queryset, chunk_size=chunk_size)
+
+        filename = f"tickets_{timezone.localtime():%Y%m%d_%H%M%S}.{export_format}"
+        response = StreamingHttpResponse(content, content_type=request.accepted_renderer.media_type)
+        response['Content-Disposition'] = f'attachment; filename="{filename}"'
+        return response
+
 @api_view(['GET'])
+@cached_response('stats', params=FILTER_PARAMS)
 def get_stats(request):
     
-    queryset = get_filtered_queryset(request)
+    return Response(compute_stats(*get_stats_queryset(request)))
 
-    total = queryset.aggregate(total=Count('number'))['total']
-    violations = queryset.filter(is_sla_violated=True).aggregate(count=Count('number'))['count']
-    compliance = total - violations
-    rate = (compliance / total * 100) if total > 0 else 0
 
-    low_priority = queryset.filter(priority='4 - Low').aggregate(count=Count('number'))['count']
-    medium_priority = queryset.filter(priority='3 - Medium').aggregate(count=Count('number'))['count']
-    high_priority = queryset.filter(priority='2 - High').aggregate(count=Count('number'))['count']
-    critical_priority = queryset.filter(priority='1 - Critical').aggregate(count=Count('number'))['count']
-    avg_duration = queryset.aggregate(avg=Avg('resolution_duration'))['avg'] or 0
-    avg_compliance = queryset.aggregate(avg=Avg('application_sla_compliance_rate'))['avg'] or 0
-
-    data = {
-        'total_tickets': total,
-        'violation_count': violations,
-        'compliance_count': compliance,
-        'compliance_rate': round(rate, 1),
-        'low_priority_count': low_priority,
-        'medium_priority_count': medium_priority,
-        'high_priority_count': high_priority,
-        'critical_priority_count': critical_priority,
-        'avg_resolution_duration': round(avg_duration, 2),
-        'avg_compliance_rate': round(avg_compliance * 100, 1),
+@api_view(['GET'])
+@cached_response('dashboard-summary', params=(*FILTER_PARAMS, 'sections'), version=summary_file_signature)
+def get_dashboard_summary(request):
+    """
+    Data awal Dashboard/Analytics dalam satu request.
+    Query: ?sections=stats,violation_by_category,monthly_trend,feature_importance,clusters,unique_values
+    (default semua), plus filter priority/is_sla_violated untuk bagian statistik tiket.
+    Query DB memakai satu queryset terfilter dan dijalankan paralel.
+    Bagian yang gagal tidak ikut di response; pesannya ada di errors: {bagian: pesan}.
+    """
+    sections = request.query_params.get('sections')
+    sections = [name.strip() for name in sections.split(',') if name.strip()] if sections else list(SUMMARY_SECTIONS)
+    unknown = [name for name in sections if name not in SUMMARY_SECTIONS]
+    if unknown:
+        return Response({'error': f"sections tidak dikenal: {', '.join(unknown)}. Pilihan: {', '.join(SUMMARY_SECTIONS)}"}, status=400)
+
+    queryset, rollup = get_stats_queryset(request)
+    futures = {
+        name: dashboard_executor.submit(run_db_task, SUMMARY_DB_SECTIONS[name], queryset, rollup)
+        for name in sections if name in SUMMARY_DB_SECTIONS
     }
-    return Response(data)
+    data = {}
+    errors = {}
+    # Bagian tanpa DB lebih dulu, sementara query berjalan di dashboard_executor
+    for name in [*(name for name in sections if name not in futures), *futures]:
+        try:
+            data[name] = futures[name].result() if name in futures else SUMMARY_LOCAL_SECTIONS[name]()
+        except Exception as e:
+            print(f"Dashboard summary error ({name}): {type(e).__name__}: {e}")
+            errors[name] = f'{type(e).__name__}: {e}'
+
+    if not errors:
+        return Response(data)
+    data['errors'] = errors
+    response = Response(data)
+    response['Cache-Control'] = 'no-store'  # Jangan di-cache: bagian yang gagal dicoba lagi di request berikutnya
+    return response
@@ -54,34 +54,6 @@ const Analytics = () => {
   useEffect(() => {
     let isMounted = true; // Flag to prevent state updates on unmounted component
 
-    // Helper function to fetch and process data
-    const fetchData = async (url, dataSetter, loadingKey, processFunc = null) => {
-      try {
-        const response = await fetch(url);
-        if (!response.ok) {
-          throw new Error(`HTTP error! status: ${response.status} fetching ${loadingKey}`);
-        }
-        let data = await response.json();
-        // Optional processing step specific to each fetch
-        if (processFunc) {
-          data = processFunc(data); // Process into ChartJS format
-        }
-        if (isMounted) {
-          dataSetter(data); // Set the processed (or raw for clusters) data
-        }
-      } catch (err) {
-        console.error(`Error fetching ${loadingKey}:`, err);
-        if (isMounted) {
-          setError(prev => prev ? `${prev}\nFailed to load ${loadingKey}.` : `Failed to load ${loadingKey}.`);
-          dataSetter(null); // Set data to null on error
-        }
-      } finally {
-        if (isMounted) {
-          setLoading(prev => ({ ...prev, [loadingKey]: false }));
-        }
-      }
-    };
-
     // --- Define Processing Functions ---
 
     // Process Violation Data for ChartJS
@@ -129,12 +101,46 @@ const Analytics = () => {
       };
     };
 
-    // --- Perform Fetches ---
-    fetchData('http://localhost:8000/api/stats/violation-by-category/', setViolationData, 'violation', processViolationData);
-    fetchData('http://localhost:8000/api/stats/monthly-trend/', setTrendData, 'trend', processTrendData);
-    fetchData('http://localhost:8000/api/stats/feature-importance/', setImportanceData, 'importance', processImportanceData);
-    // Fetch raw cluster data, processing will happen using useMemo below
-    fetchData('http://localhost:8000/api/clusters/', setClusterAPIData, 'clusters');
+    // --- Perform Fetch ---
+    // One round-trip for all charts; sections share one filtered queryset on the backend.
+    // A section that fails on the backend is listed in data.errors, the other charts still render.
+    const sectionLabels = {
+      violation_by_category: 'violation',
+      monthly_trend: 'trend',
+      feature_importance: 'importance',
+      clusters: 'clusters',
+    };
+    const fetchSummary = async () => {
+      try {
+        const response = await fetch(`http://localhost:8000/api/dashboard/summary/?sections=${Object.keys(sectionLabels).join(',')}`);
+        if (!response.ok) {
+          throw new Error(`HTTP error! status: ${response.status} fetching summary`);
+        }
+        const data = await response.json();
+        if (isMounted) {
+          setViolationData(processViolationData(data.violation_by_category));
+          setTrendData(processTrendData(data.monthly_trend));
+          setImportanceData(processImportanceData(data.feature_importance));
+          // Raw cluster data, processing will happen using useMemo below
+          setClusterAPIData(data.clusters ?? null);
+          const failed = Object.keys(data.errors || {});
+          if (failed.length > 0) {
+            console.error('Summary section errors:', data.errors);
+            setError(failed.map(name => `Failed to load ${sectionLabels[name] || name}.`).join('\n'));
+          }
+        }
+      } catch (err) {
+        console.error('Error fetching summary:', err);
+        if (isMounted) {
+          setError('Failed to load analytics data.');
+        }
+      } finally {
+        if (isMounted) {
+          setLoading({ violation: false, trend: false, importance: false, clusters: false });
+        }
+      }
+    };
+    fetchSummary();
 
     // Cleanup function
     return () => {
@@ -1,4 +1,4 @@
-import { useCallback, useEffect, useState } from 'react';
+import { useCallback, useEffect, useRef, useState } from 'react';
 import TicketDetailModal from './TicketDetailModal';
 
 const Dashboard = () => {
@@ -39,42 +39,32 @@ const Dashboard = () => {
     handleSearchChange.timeoutId = setTimeout(debouncedSearch, 300);
   };
 
-  // Fetch unique (untuk dropdown filter)
-  useEffect(() => {
-    console.log('Fetching unique filter values...');
-    fetch('http://localhost:8000/api/unique-values/')
-      .then(res => {
-        if (!res.ok) throw new Error('Gagal mengambil data filter kategori');
-        return res.json();
-      })
-      .then(data => {
-        if (data && Array.isArray(data.categories)) {
-          setCategories(data.categories);
-        }
-      })
-      .catch(err => {
-        console.error('Error fetching unique values:', err);
-      });
-  }, []);
+  // Opsi kategori cukup diambil sekali (ikut request summary pertama)
+  const needUniqueValues = useRef(true);
 
-  // Fetch stats (DI MODIFIKASI)
+  // Fetch stats + unique values (dropdown filter) lewat satu request /api/dashboard/summary/
   useEffect(() => {
-    console.log('Fetching stats...');
+    console.log('Fetching dashboard summary...');
     setLoadingStats(true);
 
-    // BARU: Logika pembuatan URL yang lebih baik untuk banyak filter
-    const params = new URLSearchParams();
+    const sections = needUniqueValues.current ? ['stats', 'unique_values'] : ['stats'];
+    const params = new URLSearchParams({ sections: sections.join(',') });
     if (priorityFilter !== 'all') {
       params.append('priority', priorityFilter);
     }
     if (violationFilter !== 'all') {
       params.append('is_sla_violated', violationFilter);
     }
-    
-    const queryString = params.toString();
-    const url = `http://localhost:8000/api/stats/${queryString ? '?' + queryString : ''}`;
-    
-    console.log('Stats URL:', url); // Debug URL baru
+
+    const url = `http://localhost:8000/api/dashboard/summary/?${params.toString()}`;
+    console.log('Summary URL:', url);
+
+    const fallbackStats = { // Set fallback agar tidak crash
+      total_tickets: 0,
+      violation_count: 0,
+      compliance_count: 0,
+      compliance_rate: 0,
+    };
 
     fetch(url)
       .then(res => {
@@ -82,21 +72,23 @@ const Dashboard = () => {
         return res.json();
       })
       .then(data => {
-        console.log('Stats data received:', data);
-        setStats(data);
+        console.log('Summary data received:', data);
+        if (data.errors) {
+          console.error('Summary section errors:', data.errors);
+        }
+        // Tiap bagian dipakai sendiri: stats gagal tidak menghapus dropdown kategori, dan sebaliknya
+        setStats(data.stats || fallbackStats);
+        if (data.unique_values && Array.isArray(data.unique_values.categories)) {
+          setCategories(data.unique_values.categories);
+          needUniqueValues.current = false;
+        }
         setLoadingStats(false);
       })
       .catch(err => {
-        console.error('Stats fetch error:', err);
+        console.error('Summary fetch error:', err);
         setLoadingStats(false);
-        setStats({ // Set fallback agar tidak crash
-            total_tickets: 0,
-            violation_count: 0,
-            compliance_count: 0,
-            compliance_rate: 0,
-        });
+        setStats(fallbackStats);
       });
-  // BARU: Tambahkan violationFilter sebagai dependency
   }, [priorityFilter, violationFilter]);
 
   // Fetch tickets (DI MODIFIKASI)